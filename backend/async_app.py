@@ -0,0 +1,200 @@
+import time
+from functools import wraps
+from urllib.parse import parse_qs
+from quart import Quart, Response, request, current_app, g, make_response
+from quart.wrappers.response import IterableBody
+from motor.motor_asyncio import AsyncIOMotorClient
+from asgiref.wsgi import WsgiToAsgi
+from database import MONGO_URI, DB_NAME, client_kwargs
+from app import (
+    create_app, event_list_plan, cursor_values, array_open, array_close,
+)
+from json_provider import BSONJSONProvider
+import cache
+import push
+
+# Asyncio variant of the API for high-concurrency deployments:
+#
+#   uvicorn async_app:application --workers 2
+#
+# The read-heavy list endpoints are served natively on the event loop with
+# Motor, so thousands of idle-waiting requests cost a coroutine each instead
+# of a worker thread. Every other route is handed to the regular Flask app,
+# so clients see the same API either way.
+
+async_api = Quart(__name__)
+async_api.json = BSONJSONProvider(async_api)
+
+@async_api.before_serving
+async def connect():
+    # Created inside the running loop of each uvicorn worker
+    async_api.motor = AsyncIOMotorClient(MONGO_URI, **client_kwargs())
+    async_api.db = async_api.motor[DB_NAME]
+
+@async_api.after_serving
+async def disconnect():
+    async_api.motor.close()
+
+@async_api.before_request
+async def start_timer():
+    g.started = time.perf_counter()
+
+@async_api.after_request
+async def allow_cors(response):
+    # Mirrors flask_cors defaults of the sync app; preflights go to Flask
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    response.headers['Access-Control-Expose-Headers'] = 'Server-Timing, X-Profile-Report'
+    return response
+
+@async_api.after_request
+async def add_server_timing(response):
+    # Same header as profiling.py, but total only: Motor runs its commands
+    # on executor threads, where they cannot be attributed to a request
+    if response.mimetype != 'text/event-stream':
+        response.headers['Server-Timing'] = f'total;dur={(time.perf_counter() - g.started) * 1000:.1f}'
+        response.headers['Timing-Allow-Origin'] = '*'
+    return response
+
+async def buffer_body(response):
+    # Async counterpart of cache.buffer_body
+    chunks = []
+    size = 0
+    rest = response.response.__aiter__()
+    async for chunk in rest:
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > cache.CACHE_MAX_ENTRY_BYTES:
+            response.response = IterableBody(resume(chunks, rest))
+            return None
+    await close_iterator(rest)
+    return b''.join(chunks)
+
+async def resume(chunks, rest):
+    try:
+        for chunk in chunks:
+            yield chunk
+        async for chunk in rest:
+            yield chunk
+    finally:
+        await close_iterator(rest)
+
+async def close_iterator(iterator):
+    close = getattr(iterator, 'aclose', None)
+    if close is not None:
+        await close()
+
+def cached(namespace, ttl=cache.CACHE_TTL_SECONDS):
+    # Async counterpart of cache.cached: same backend, keys and ETags, so a
+    # write through the Flask app invalidates these entries too
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(*args, **kwargs):
+            if cache.backend is None or cache.is_per_user(request.args):
+                return await view(*args, **kwargs)
+            key = cache.make_key(namespace, request.path, request.args)
+            entry = cache.backend.get(key)
+            if entry is None:
+                response = await make_response(await view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                body = await buffer_body(response)
+                if body is None:
+                    return response
+                entry = cache.make_entry(body, response.mimetype)
+                cache.backend.set(key, entry, ttl)
+            response = Response(entry['body'], mimetype=entry['mimetype'])
+            response.set_etag(entry['etag'])
+            response.headers['Cache-Control'] = 'no-cache'
+            return await response.make_conditional(request)
+        return wrapper
+    return decorator
+
+def mark_registered(db, user_id):
+    async def enrich(chunk):
+        ids = [str(event['_id']) for event in chunk]
+        registered = {
+            doc['eventId'] async for doc in db.registrations.find(
+                {'userId': user_id, 'eventId': {'$in': ids}}, {'_id': 0, 'eventId': 1}
+            )
+        }
+        for event in chunk:
+            event['isRegistered'] = str(event['_id']) in registered
+    return enrich
+
+def stream_json_array(cursor, key=None, sort_field='_id', limit=None, enrich=None, chunk_size=100):
+    # Async counterpart of app.stream_json_array over a Motor cursor
+    dumps = current_app.json.dumps_bytes
+
+    async def generate():
+        yield array_open(key)
+        count = 0
+        last = None
+        while True:
+            chunk = await cursor.to_list(length=chunk_size)
+            if not chunk:
+                break
+            if enrich:
+                await enrich(chunk)
+            for doc in chunk:
+                last = cursor_values(doc, sort_field)
+                yield (b',' if count else b'') + dumps(doc)
+                count += 1
+        yield array_close(key, last, limit, count, dumps)
+
+    return Response(generate(), mimetype='application/json')
+
+@async_api.route('/api/events', methods=['GET'])
+@cached('events')
+async def get_events():
+    db = async_api.db
+    user_id = request.args.get('userId')
+    try:
+        plan = event_list_plan(request.args)
+    except ValueError as e:
+        return {'error': str(e)}, 400
+
+    enrich = mark_registered(db, user_id) if user_id else None
+    docs = db.events.find(plan['query'], plan['projection'])
+    if not plan['limit']:
+        return stream_json_array(docs, enrich=enrich)
+
+    page = docs.sort(plan['sort']).limit(plan['limit'])
+    return stream_json_array(page, key='events', sort_field=plan['sort_field'], limit=plan['limit'], enrich=enrich)
+
+@async_api.route('/api/announcements', methods=['GET'])
+@cached('announcements')
+async def get_announcements():
+    return stream_json_array(async_api.db.announcements.find().sort('date', -1))
+
+@async_api.route('/api/forum/threads', methods=['GET'])
+@cached('forum')
+async def get_forum_threads():
+    return stream_json_array(async_api.db.forum_threads.find().sort('createdAt', -1))
+
+@async_api.route('/api/stream', methods=['GET'])
+async def stream_updates():
+    # Same stream as the Flask route, but an idle client costs a coroutine
+    # instead of a worker thread
+    try:
+        stream = push.async_event_stream(push.parse_topics(request.args.get('topics')), request.headers.get('Last-Event-ID'))
+    except push.TooManySubscribers as e:
+        return {'error': str(e)}, 503
+    response = Response(stream, mimetype='text/event-stream', headers={
+        'Cache-Control': 'no-cache',
+        'X-Accel-Buffering': 'no',
+    })
+    response.timeout = None
+    return response
+
+# Everything else (including ?since= delta sync) runs in the thread pool
+# through the regular Flask app
+ASYNC_ROUTES = {'/api/events', '/api/announcements', '/api/forum/threads', '/api/stream'}
+flask_app = WsgiToAsgi(create_app())
+
+async def application(scope, receive, send):
+    if scope['type'] == 'lifespan':
+        return await async_api(scope, receive, send)
+    if scope['type'] == 'http' and scope['method'] == 'GET' and scope['path'] in ASYNC_ROUTES \
+            and 'since' not in parse_qs(scope['query_string'].decode(), keep_blank_values=True):
+        return await async_api(scope, receive, send)
+    return await flask_app(scope, receive, send)
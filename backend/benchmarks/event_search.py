@@ -0,0 +1,112 @@
+import argparse
+import os
+import re
+import sys
+import time
+from datetime import date, timedelta
+from urllib.parse import quote
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Latency of GET /api/events/search at realistic collection sizes. Seeds the
+# configured MongoDB with synthetic events (seed_database.py's generator),
+# then runs each query through the Flask app with the response cache off and
+# reports p50/p95/p99 of the whole request and of the MongoDB part of it
+# (from the Server-Timing header).
+#
+#   cd backend && python benchmarks/event_search.py --events 1e5
+#   python benchmarks/event_search.py --skip-seed --iterations 500
+#
+# Needs a real mongod: mongomock has no $text search. The target is the
+# first page, facets included, in under 10 ms at 100k events.
+
+def queries():
+    today = date.today()
+    soon = (today + timedelta(days=90)).isoformat()
+    return [
+        ('one term', 'q=pottery'),
+        ('two terms', 'q=heritage%20walk'),
+        ('term + category', 'q=yoga&category=Health'),
+        ('term + date range', f'q=mumbai&from={today.isoformat()}&to={soon}'),
+        ('broad term', 'q=sports'),
+        ('filters only', f'category=Education&from={today.isoformat()}&to={soon}'),
+        ('page 2', None),
+    ]
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(p / 100 * len(values)))]
+
+def db_ms(response):
+    match = re.search(r'db;dur=([\d.]+)', response.headers.get('Server-Timing', ''))
+    return float(match.group(1)) if match else 0.0
+
+def run_query(client, path, iterations):
+    for _ in range(max(3, iterations // 10)):
+        client.get(path)  # warm up
+    totals, dbs = [], []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        response = client.get(path)
+        totals.append((time.perf_counter() - started) * 1000)
+        assert response.status_code == 200, response.get_json()
+        dbs.append(db_ms(response))
+    return response.get_json(), totals, dbs
+
+def parse_count(value):
+    # Same as seed_database.parse_count; importing that module here would read
+    # the settings below before they are set
+    return int(float(value))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--events', type=parse_count, default=100000)
+    parser.add_argument('--users', type=parse_count, default=100, help='registrants are drawn from these')
+    parser.add_argument('--skip-seed', action='store_true', help='reuse data from a previous run')
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    # Measure the queries, not the response cache; Server-Timing needs timing on
+    os.environ['RESPONSE_CACHE_BACKEND'] = 'off'
+    os.environ['REQUEST_TIMING'] = 'true'
+    os.environ['SLOW_REQUEST_MS'] = '0'
+
+    import seed_database
+    from app import create_app
+    from database import get_db
+
+    db = get_db()
+    if not args.skip_seed:
+        print(f"🌱 Seeding {args.events} events...")
+        seed_database.clear_collections(db)
+        seed_database.generate(db, argparse.Namespace(
+            users=args.users, events=args.events, announcements=0, threads=0, volunteers=0,
+            workers=args.workers, batch_size=1000, seed=args.seed,
+        ))
+
+    client = create_app().test_client()
+    events = db.events.estimated_document_count()
+    print(f"🔎 /api/events/search over {events} events, {args.iterations} requests per query, limit={args.limit}\n")
+    print(f"{'query':<20} {'matches':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'db p50':>8} {'db p95':>8}")
+
+    next_cursor = None
+    for label, query in queries():
+        if query is None:
+            if not next_cursor:
+                continue
+            query = f'q=pottery&cursor={quote(next_cursor)}'
+        body, totals, dbs = run_query(client, f'/api/events/search?{query}&limit={args.limit}', args.iterations)
+        if label == 'one term':
+            next_cursor = body['nextCursor']
+        matches = body.get('total', '-')
+        if body.get('truncated'):
+            matches = f'{matches}+'
+        print(f"{label:<20} {matches:>8} {percentile(totals, 50):>8.2f} {percentile(totals, 95):>8.2f} "
+              f"{percentile(totals, 99):>8.2f} {percentile(dbs, 50):>8.2f} {percentile(dbs, 95):>8.2f}")
+    print()
+
+if __name__ == '__main__':
+    main()
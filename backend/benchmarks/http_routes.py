@@ -0,0 +1,467 @@
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# HTTP benchmark for the backend routes. Seeds the configured MongoDB (or an
+# in-memory mongomock) with synthetic data, serves create_app() in-process on
+# a threaded server and drives it with weighted request mixes. Reports
+# p50/p95/p99 latency, throughput and MongoDB commands per request, overall
+# and per route, and saves everything as JSON for diffing between commits.
+#
+#   cd backend && python benchmarks/http_routes.py --mongomock
+#   python benchmarks/http_routes.py --mix browse --users 1e5 --events 1e4 --duration 30
+#   python benchmarks/http_routes.py --compare benchmarks/results/http_<old>.json
+#
+# DB ops are counted with a pymongo command listener, so they are only
+# available against a real mongod.
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIR = os.path.join(BACKEND_DIR, 'benchmarks', 'results')
+
+# ==================== REQUEST MIXES ====================
+#
+# Each entry is (weight, route label, fn(ctx, rng) -> (method, path, body, token)).
+
+def pick(rng, kind, count):
+    from seed_database import synthetic_id
+    return str(synthetic_id(kind, rng.randrange(count)))
+
+def take(ctx, key):
+    # Ids that can only be used once (deletes); once exhausted an unknown id
+    # keeps exercising the route's 404 path
+    try:
+        return ctx[key].popleft()
+    except IndexError:
+        from bson import ObjectId
+        return str(ObjectId())
+
+def browse_user(ctx, rng):
+    return pick(rng, 'users', ctx['users'])
+
+BROWSE = [
+    (10, 'GET /api/events', lambda ctx, rng: ('GET', '/api/events', None, None)),
+    (20, 'GET /api/events?limit', lambda ctx, rng: ('GET', '/api/events?limit=20', None, None)),
+    (10, 'GET /api/events?userId', lambda ctx, rng: ('GET', f'/api/events?limit=20&userId={browse_user(ctx, rng)}', None, None)),
+    (20, 'GET /api/events/<id>', lambda ctx, rng: ('GET', f"/api/events/{pick(rng, 'events', ctx['events'])}", None, None)),
+    (10, 'GET /api/announcements', lambda ctx, rng: ('GET', '/api/announcements', None, None)),
+    (10, 'GET /api/forum/threads', lambda ctx, rng: ('GET', '/api/forum/threads', None, None)),
+    (2, 'GET /api/volunteers', lambda ctx, rng: ('GET', '/api/volunteers', None, None)),
+    (5, 'GET /api/volunteers/event/<id>', lambda ctx, rng: ('GET', f"/api/volunteers/event/{pick(rng, 'events', ctx['events'])}", None, None)),
+    (5, 'GET /api/volunteers/user/<id>', lambda ctx, rng: ('GET', f'/api/volunteers/user/{browse_user(ctx, rng)}', None, None)),
+    (3, 'GET /api/events/user/<id>', lambda ctx, rng: ('GET', f"/api/events/user/{pick(rng, 'users', max(1, ctx['users'] // 50))}", None, None)),
+    (5, 'GET /api/users/<id>', lambda ctx, rng: ('GET', f'/api/users/{browse_user(ctx, rng)}', None, None)),
+]
+
+def hot_event(ctx, rng):
+    # A rush concentrates on a handful of events
+    return pick(rng, 'events', min(ctx['events'], 5))
+
+def signup(ctx, rng):
+    n = next(ctx['counter'])
+    body = {'name': f'Rush User {n}', 'email': f'rush{n}-{ctx["run"]}@load.samudaya.test', 'password': 'password123'}
+    return 'POST', '/api/auth/register', body, None
+
+def login(ctx, rng):
+    body = {'email': f"user{rng.randrange(ctx['users'])}@load.samudaya.test", 'password': 'password123'}
+    return 'POST', '/api/auth/login', body, None
+
+def forgot_password(ctx, rng):
+    return 'POST', '/api/auth/forgot-password', {'email': f"user{rng.randrange(ctx['users'])}@load.samudaya.test"}, None
+
+def logout(ctx, rng):
+    # Logout revokes every token of the user, so mint a current one each time
+    from seed_database import synthetic_id
+    from sessions import issue_token
+    user = ctx['db'].users.find_one({'_id': synthetic_id('users', rng.randrange(ctx['users']))}, {'role': 1, 'tokenVersion': 1})
+    return 'POST', '/api/auth/logout', None, issue_token(user)
+
+REGISTRATION_RUSH = [
+    (40, 'POST /api/events/<id>/register', lambda ctx, rng: ('POST', f'/api/events/{hot_event(ctx, rng)}/register', {'userId': browse_user(ctx, rng), 'waitlist': True}, None)),
+    (15, 'POST /api/events/<id>/unregister', lambda ctx, rng: ('POST', f'/api/events/{hot_event(ctx, rng)}/unregister', {'userId': browse_user(ctx, rng)}, None)),
+    (15, 'GET /api/events/<id>', lambda ctx, rng: ('GET', f'/api/events/{hot_event(ctx, rng)}', None, None)),
+    (10, 'GET /api/events?userId', lambda ctx, rng: ('GET', f'/api/events?limit=20&userId={browse_user(ctx, rng)}', None, None)),
+    (5, 'POST /api/volunteers', lambda ctx, rng: ('POST', '/api/volunteers', {'userId': browse_user(ctx, rng), 'eventId': hot_event(ctx, rng), 'role': 'Setup Team'}, None)),
+    (5, 'POST /api/auth/login', login),
+    (2, 'POST /api/auth/register', signup),
+    (1, 'POST /api/auth/forgot-password', forgot_password),
+    (1, 'POST /api/auth/logout', logout),
+]
+
+def admin(method, path, body=None):
+    return lambda ctx, rng: (method, path(ctx, rng) if callable(path) else path, body, ctx['admin_token'])
+
+ADMIN_DASHBOARD = [
+    (25, 'GET /api/admin/stats', admin('GET', '/api/admin/stats')),
+    (20, 'GET /api/admin/events/pending', admin('GET', '/api/admin/events/pending')),
+    (10, 'PUT /api/admin/events/<id>/approve', admin('PUT', lambda ctx, rng: f"/api/admin/events/{pick(rng, 'events', ctx['events'])}/approve")),
+    (5, 'PUT /api/admin/events/<id>/reject', admin('PUT', lambda ctx, rng: f"/api/admin/events/{pick(rng, 'events', ctx['events'])}/reject")),
+    (5, 'GET /api/users', lambda ctx, rng: ('GET', '/api/users', None, None)),
+    (5, 'PUT /api/users/<id>', admin('PUT', lambda ctx, rng: f'/api/users/{browse_user(ctx, rng)}', {'bio': 'Updated during benchmark'})),
+    (5, 'POST /api/events', lambda ctx, rng: ('POST', '/api/events', {
+        'title': 'Benchmark Event', 'description': 'Created by the benchmark', 'date': '2026-12-01',
+        'time': '10:00 AM', 'location': 'Cubbon Park, Bengaluru', 'category': 'Volunteer',
+        'capacity': 100, 'creator': pick(rng, 'users', max(1, ctx['users'] // 50)), 'tags': ['community'],
+    }, None)),
+    (5, 'PUT /api/events/<id>', lambda ctx, rng: ('PUT', f"/api/events/{pick(rng, 'events', ctx['events'])}", {'description': 'Edited during benchmark'}, None)),
+    (2, 'DELETE /api/events/<id>', lambda ctx, rng: ('DELETE', f"/api/events/{take(ctx, 'events_to_delete')}", None, None)),
+    (5, 'POST /api/announcements', lambda ctx, rng: ('POST', '/api/announcements', {'title': 'Benchmark', 'content': 'Announcement', 'type': 'Info', 'author': 'Admin Team'}, None)),
+    (2, 'DELETE /api/announcements/<id>', lambda ctx, rng: ('DELETE', f"/api/announcements/{take(ctx, 'announcements_to_delete')}", None, None)),
+    (5, 'POST /api/forum/threads', lambda ctx, rng: ('POST', '/api/forum/threads', {'title': 'Benchmark thread', 'author': 'Admin Team', 'category': 'General'}, None)),
+    (3, 'PUT /api/forum/threads/<id>/pin', lambda ctx, rng: ('PUT', f"/api/forum/threads/{pick(rng, 'forum_threads', ctx['threads'])}/pin", None, None)),
+    (2, 'DELETE /api/forum/threads/<id>', lambda ctx, rng: ('DELETE', f"/api/forum/threads/{take(ctx, 'threads_to_delete')}", None, None)),
+    (3, 'GET /api/_metrics', lambda ctx, rng: ('GET', '/api/_metrics', None, None)),
+    (1, 'GET /api/test', lambda ctx, rng: ('GET', '/api/test', None, None)),
+]
+
+MIXES = {
+    'browse': BROWSE,
+    'registration-rush': REGISTRATION_RUSH,
+    'admin-dashboard': ADMIN_DASHBOARD,
+}
+
+# ==================== SERVER + DB OP COUNTING ====================
+
+def install_op_counter():
+    # Counts commands per request on the server thread handling it; must be
+    # registered before the MongoClient is created
+    from pymongo import monitoring
+
+    local = threading.local()
+
+    class OpCounter(monitoring.CommandListener):
+        def started(self, event):
+            if getattr(local, 'ops', None) is not None:
+                local.ops += 1
+
+        def succeeded(self, event):
+            pass
+
+        def failed(self, event):
+            pass
+
+    monitoring.register(OpCounter())
+    return local
+
+class CountingMiddleware:
+    # Attributes the commands issued while serving (and streaming) a request
+    # to the route label sent by the client in X-Bench-Route
+    def __init__(self, app, local):
+        self.app = app
+        self.local = local
+        self.lock = threading.Lock()
+        self.ops = {}
+
+    def __call__(self, environ, start_response):
+        route = environ.get('HTTP_X_BENCH_ROUTE')
+        self.local.ops = 0
+        body = self.app(environ, start_response)
+        try:
+            yield from body
+        finally:
+            if hasattr(body, 'close'):
+                body.close()
+            with self.lock:
+                self.ops[route] = self.ops.get(route, 0) + self.local.ops
+            self.local.ops = None
+
+    def take(self):
+        with self.lock:
+            ops, self.ops = self.ops, {}
+        return ops
+
+def serve(wsgi_app, port):
+    from werkzeug.serving import make_server, WSGIRequestHandler
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    server = make_server('127.0.0.1', port, wsgi_app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# ==================== SEEDING ====================
+
+def seed(db, args):
+    import seed_database
+    from passwords import hash_password
+
+    print(f"🌱 Seeding {args.users} users, {args.events} events, {args.volunteers} volunteers, "
+          f"{args.announcements} announcements, {args.threads} threads...")
+    started = time.time()
+    seed_database.clear_collections(db)
+    config = {
+        'users': args.users,
+        'events': args.events,
+        'seed': args.seed,
+        'batch_size': 1000,
+        'password_hashes': [hash_password('password123', offload=False)],
+    }
+    # Serially in this process: mongomock data would not be visible to child processes
+    for kind, count in [('users', args.users), ('events', args.events), ('announcements', args.announcements),
+                        ('forum_threads', args.threads), ('volunteers', args.volunteers)]:
+        for start in range(0, count, 4000):
+            seed_database.generate_chunk((kind, start, min(start + 4000, count), config))
+    db.users.insert_one({
+        'name': 'Benchmark Admin',
+        'email': 'admin@load.samudaya.test',
+        'password': config['password_hashes'][0],
+        'role': 'admin',
+        'joinDate': datetime.now().isoformat(),
+        'status': 'active',
+    })
+    print(f"✅ Seeded in {time.time() - started:.1f}s\n")
+
+def make_context(db, args, run):
+    from itertools import count
+    from sessions import issue_token
+    from seed_database import synthetic_id
+
+    admin_user = db.users.find_one({'email': 'admin@load.samudaya.test'})
+    # Deletes work through the tail of each collection, one id per request
+    tail = lambda kind, total: deque(str(synthetic_id(kind, i)) for i in range(total - 1, total // 2, -1))
+    return {
+        'db': db,
+        'users': args.users,
+        'events': args.events,
+        'threads': args.threads,
+        'run': run,
+        'counter': count(),
+        'admin_token': issue_token(admin_user),
+        'events_to_delete': tail('events', args.events),
+        'announcements_to_delete': tail('announcements', args.announcements),
+        'threads_to_delete': tail('forum_threads', args.threads),
+    }
+
+# ==================== LOAD GENERATION ====================
+
+def send(base_url, route, method, path, body, token):
+    headers = {'X-Bench-Route': route}
+    data = None
+    if body is not None:
+        data = json.dumps(body).encode()
+        headers['Content-Type'] = 'application/json'
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    request = urllib.request.Request(base_url + path, data=data, headers=headers, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+            return response.status
+    except urllib.error.HTTPError as e:
+        e.read()
+        return e.code
+
+def percentile(sorted_values, pct):
+    if not sorted_values:
+        return None
+    index = min(len(sorted_values) - 1, max(0, round(pct / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    ms = lambda value: round(value * 1000, 3) if value is not None else None
+    return {
+        'p50': ms(percentile(latencies, 50)),
+        'p95': ms(percentile(latencies, 95)),
+        'p99': ms(percentile(latencies, 99)),
+        'max': ms(latencies[-1] if latencies else None),
+        'mean': ms(sum(latencies) / len(latencies) if latencies else None),
+    }
+
+def run_mix(name, base_url, ctx, args, counter):
+    mix = MIXES[name]
+    weights = [weight for weight, _, _ in mix]
+
+    def client(worker, deadline, record):
+        rng = random.Random(f'{args.seed}:{name}:{worker}')
+        samples = []
+        while time.perf_counter() < deadline:
+            _, route, build = rng.choices(mix, weights)[0]
+            method, path, body, token = build(ctx, rng)
+            started = time.perf_counter()
+            try:
+                status = send(base_url, route, method, path, body, token)
+            except Exception:
+                status = 'error'
+            if record:
+                samples.append((route, status, time.perf_counter() - started))
+        return samples
+
+    def drive(duration, record):
+        deadline = time.perf_counter() + duration
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            return [s for samples in pool.map(lambda w: client(w, deadline, record), range(args.concurrency)) for s in samples]
+
+    if args.warmup:
+        drive(args.warmup, False)
+    if counter:
+        counter.take()
+    started = time.perf_counter()
+    samples = drive(args.duration, True)
+    elapsed = time.perf_counter() - started
+    ops = counter.take() if counter else None
+
+    routes = {}
+    for route, status, latency in samples:
+        entry = routes.setdefault(route, {'latencies': [], 'status': {}})
+        entry['latencies'].append(latency)
+        entry['status'][str(status)] = entry['status'].get(str(status), 0) + 1
+
+    per_op = lambda total, n: round(total / n, 2) if ops is not None and n else None
+    return {
+        'requests': len(samples),
+        'errors': sum(1 for _, status, _ in samples if status == 'error' or status >= 500),
+        'duration_seconds': round(elapsed, 3),
+        'throughput_rps': round(len(samples) / elapsed, 1),
+        'latency_ms': summarize([latency for _, _, latency in samples]),
+        'db_ops_per_request': per_op(sum(ops.values()) if ops else 0, len(samples)),
+        'routes': {
+            route: {
+                'requests': len(entry['latencies']),
+                'status': entry['status'],
+                'latency_ms': summarize(entry['latencies']),
+                'db_ops_per_request': per_op(ops.get(route, 0) if ops else 0, len(entry['latencies'])),
+            }
+            for route, entry in sorted(routes.items())
+        },
+    }
+
+# ==================== REPORTING ====================
+
+def git_revision():
+    try:
+        commit = subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'], cwd=BACKEND_DIR, text=True).strip()
+        dirty = bool(subprocess.check_output(['git', 'status', '--porcelain'], cwd=BACKEND_DIR, text=True).strip())
+        return commit, dirty
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown', False
+
+def fmt(value, suffix=''):
+    return f'{value}{suffix}' if value is not None else '-'
+
+def print_mix(name, result):
+    lat = result['latency_ms']
+    print(f"📊 {name}: {result['requests']} requests, {result['throughput_rps']} req/s, "
+          f"{result['errors']} errors, {fmt(result['db_ops_per_request'])} DB ops/request")
+    print(f"   overall p50 {fmt(lat['p50'])} ms, p95 {fmt(lat['p95'])} ms, p99 {fmt(lat['p99'])} ms\n")
+    print(f"   {'route':<40} {'n':>6} {'p50':>9} {'p95':>9} {'p99':>9} {'ops':>6}  status")
+    for route, entry in result['routes'].items():
+        lat = entry['latency_ms']
+        status = ' '.join(f'{code}x{n}' for code, n in sorted(entry['status'].items()))
+        print(f"   {route:<40} {entry['requests']:>6} {fmt(lat['p50']):>9} {fmt(lat['p95']):>9} "
+              f"{fmt(lat['p99']):>9} {fmt(entry['db_ops_per_request']):>6}  {status}")
+    print()
+
+def change(old, new):
+    if old is None or new is None or not old:
+        return '-'
+    return f'{(new - old) / old * 100:+.1f}%'
+
+def compare(baseline_path, results):
+    with open(baseline_path) as f:
+        baseline = json.load(f)
+    print(f"🔍 Compared with {baseline['commit']} ({baseline_path})\n")
+    print(f"   {'mix':<20} {'req/s':>9} {'p50':>9} {'p95':>9} {'p99':>9} {'ops/req':>9}")
+    for name, result in results['mixes'].items():
+        old = baseline['mixes'].get(name)
+        if not old:
+            continue
+        print(f"   {name:<20} {change(old['throughput_rps'], result['throughput_rps']):>9} "
+              f"{change(old['latency_ms']['p50'], result['latency_ms']['p50']):>9} "
+              f"{change(old['latency_ms']['p95'], result['latency_ms']['p95']):>9} "
+              f"{change(old['latency_ms']['p99'], result['latency_ms']['p99']):>9} "
+              f"{change(old['db_ops_per_request'], result['db_ops_per_request']):>9}")
+    print()
+
+def parse_count(value):
+    # Same as seed_database.parse_count; importing it would create the
+    # MongoClient before --mongomock is applied
+    return int(float(value))
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--mix', nargs='+', choices=list(MIXES), default=list(MIXES))
+    parser.add_argument('--mongomock', action='store_true', help='run against an in-memory mongomock database')
+    parser.add_argument('--users', type=parse_count, default=2000)
+    parser.add_argument('--events', type=parse_count, default=200)
+    parser.add_argument('--volunteers', type=parse_count, default=1000)
+    parser.add_argument('--announcements', type=parse_count, default=100)
+    parser.add_argument('--threads', type=parse_count, default=500, help='forum threads')
+    parser.add_argument('--skip-seed', action='store_true', help='reuse data from a previous run')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--warmup', type=float, default=2)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--port', type=int, default=5056)
+    parser.add_argument('--output', help='results file (default benchmarks/results/http_<commit>.json)')
+    parser.add_argument('--compare', help='previous results file to diff against')
+    args = parser.parse_args()
+
+    if args.mongomock:
+        import mongomock
+        import pymongo
+        pymongo.MongoClient = mongomock.MongoClient
+        counter_local = None
+    else:
+        counter_local = install_op_counter()
+
+    from app import create_app
+    from database import get_db
+
+    db = get_db()
+    if args.skip_seed:
+        print("♻️  Reusing existing data\n")
+    else:
+        seed(db, args)
+
+    flask_app = create_app()
+    counter = CountingMiddleware(flask_app.wsgi_app, counter_local) if counter_local else None
+    if counter:
+        flask_app.wsgi_app = counter
+    server = serve(flask_app, args.port)
+    base_url = f'http://127.0.0.1:{args.port}'
+
+    commit, dirty = git_revision()
+    results = {
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'database': 'mongomock' if args.mongomock else 'mongod',
+        'config': {key: value for key, value in vars(args).items() if key not in ('output', 'compare')},
+        'mixes': {},
+    }
+
+    print(f"🏋️  {args.concurrency} concurrent clients, {args.duration}s per mix after {args.warmup}s warmup\n")
+    try:
+        for run, name in enumerate(args.mix):
+            results['mixes'][name] = run_mix(name, base_url, make_context(db, args, f'{commit}-{time.time_ns()}-{run}'), args, counter)
+            print_mix(name, results['mixes'][name])
+    finally:
+        server.shutdown()
+
+    output = args.output or os.path.join(RESULTS_DIR, f"http_{commit}{'-dirty' if dirty else ''}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(f"💾 Results saved to {output}\n")
+
+    if args.compare:
+        compare(args.compare, results)
+
+if __name__ == '__main__':
+    main()
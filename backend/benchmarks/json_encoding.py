@@ -0,0 +1,75 @@
+import argparse
+import os
+import sys
+import time
+from datetime import datetime
+from bson import ObjectId
+from flask import Flask
+from flask.json.provider import DefaultJSONProvider
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from json_provider import BSONJSONProvider, orjson
+
+# Encoding throughput: the old serialize_doc + Flask default provider path
+# against BSONJSONProvider, one list of synthetic event documents each.
+#
+#   python benchmarks/json_encoding.py --docs 20000 --registrants 50
+
+def make_events(count, registrants):
+    return [
+        {
+            '_id': ObjectId(),
+            'title': f'Community Event {i}',
+            'description': 'Join us for a community cleanup drive to keep our parks beautiful and clean.',
+            'date': '2025-10-15',
+            'time': '9:00 AM',
+            'location': 'Cubbon Park, Bengaluru',
+            'category': 'Volunteer',
+            'capacity': 500,
+            'registered': registrants,
+            'registeredUsers': [str(ObjectId()) for _ in range(registrants)],
+            'creator': str(ObjectId()),
+            'status': 'published',
+            'tags': ['cleanup', 'environment', 'community'],
+            'createdAt': datetime.now().isoformat(),
+        }
+        for i in range(count)
+    ]
+
+def legacy_encode(provider, docs):
+    # serialize_doc only stringified the top-level _id
+    for doc in docs:
+        doc['_id'] = str(doc['_id'])
+    return provider.dumps(docs).encode()
+
+def run(label, encode, make_docs, repeat):
+    best = None
+    size = 0
+    for _ in range(repeat):
+        docs = make_docs()
+        started = time.perf_counter()
+        size = len(encode(docs))
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    print(f"  {label:<28} {best * 1000:>9.1f} ms {size / best / 1e6:>9.1f} MB/s")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--docs', type=int, default=20000)
+    parser.add_argument('--registrants', type=int, default=50)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    app = Flask(__name__)
+    legacy = DefaultJSONProvider(app)
+    fast = BSONJSONProvider(app)
+    events = make_events(args.docs, args.registrants)
+
+    print(f"\n📦 {args.docs} events x {args.registrants} registrants (orjson: {'yes' if orjson else 'no'})\n")
+    run('serialize_doc + jsonify', lambda docs: legacy_encode(legacy, docs), lambda: [dict(e) for e in events], args.repeat)
+    run('BSONJSONProvider', fast.dumps_bytes, lambda: events, args.repeat)
+    run('BSONJSONProvider per doc', lambda docs: b','.join(fast.dumps_bytes(d) for d in docs), lambda: events, args.repeat)
+    print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+import bson
+from bson import ObjectId
+from flask import Flask
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from json_provider import BSONJSONProvider
+
+# Allocation benchmark for the announcement/forum list responses.
+# Announcement-like documents are BSON-encoded into driver-sized batches up
+# front, then each path turns them into a response body under tracemalloc:
+#   list     - list(find()) + jsonify: every document decoded, then one body
+#   streamed - stream_json_array: one batch decoded at a time, each document
+#              encoded and handed to the socket (here: only counted)
+#
+#   python benchmarks/list_streaming_alloc.py --docs 100000
+
+BATCH_SIZE = 1000
+
+def make_batches(count):
+    now = datetime.now()
+    batches = []
+    for start in range(0, count, BATCH_SIZE):
+        docs = [
+            {
+                '_id': ObjectId(),
+                'title': f'Announcement {i}',
+                'content': 'Due to heavy monsoon rains, the cleanup drive has been postponed to next week.',
+                'type': 'Info',
+                'author': 'Admin Team',
+                'date': (now - timedelta(minutes=i)).isoformat(),
+                'expiresOn': '2025-11-05',
+                'updatedAt': now,
+            }
+            for i in range(start, min(start + BATCH_SIZE, count))
+        ]
+        batches.append(b''.join(bson.encode(doc) for doc in docs))
+    return batches
+
+def list_path(batches, provider):
+    docs = [doc for batch in batches for doc in bson.decode_all(batch)]
+    return len(provider.dumps_bytes(docs))
+
+def streamed_path(batches, provider):
+    sent = 1
+    for batch in batches:
+        for doc in bson.decode_all(batch):
+            sent += len(provider.dumps_bytes(doc)) + 1
+    return sent
+
+def measure(label, path, batches, provider):
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = path(batches, provider)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  {label:<10} {elapsed * 1000:>9.1f} ms  peak {peak / 1e6:>8.1f} MB  body {size / 1e6:>6.1f} MB")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--docs', type=int, default=100000)
+    args = parser.parse_args()
+
+    provider = BSONJSONProvider(Flask(__name__))
+    batches = make_batches(args.docs)
+    print(f"\n🧮 {args.docs} documents\n")
+    measure('list', list_path, batches, provider)
+    measure('streamed', streamed_path, batches, provider)
+    print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import logging
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Login latency under different logging setups, to show what writing log
+# lines on the request thread costs:
+#
+#   sync         every login writes its debug lines straight to the sink on
+#                the request thread (what the old print() calls did)
+#   queue-debug  same records, handed to the QueueListener thread
+#   queue-info   the default: debug records are dropped before queueing
+#
+#   cd backend && python benchmarks/login_logging.py --mongomock
+#
+# Passwords use a deliberately cheap hash so logging is not drowned out by
+# key stretching; absolute numbers are therefore far below production.
+
+MODES = {
+    'sync': (False, logging.DEBUG),
+    'queue-debug': (True, logging.DEBUG),
+    'queue-info': (True, logging.INFO),
+}
+
+def run(client_factory, threads, duration):
+    deadline = time.perf_counter() + duration
+
+    def client(n):
+        http = client_factory()
+        latencies = []
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            response = http.post('/api/auth/login', json={'email': f'bench{n % 10}@load.samudaya.test', 'password': 'password123'})
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.status_code
+        return latencies
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return sorted(l for latencies in pool.map(client, range(threads)) for l in latencies)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--mongomock', action='store_true', help='run against an in-memory mongomock database')
+    parser.add_argument('--modes', nargs='+', choices=list(MODES), default=list(MODES))
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=5)
+    parser.add_argument('--sink', help='log destination file (default: a temp file; "-" for stderr)')
+    args = parser.parse_args()
+
+    # Read at import time by passwords.py
+    os.environ['PASSWORD_HASH_METHOD'] = 'pbkdf2:sha256:1'
+    os.environ['PASSWORD_HASH_WORKERS'] = '0'
+    if args.mongomock:
+        import mongomock
+        import pymongo
+        pymongo.MongoClient = mongomock.MongoClient
+
+    import logs
+    from app import create_app
+    from database import get_db
+    from passwords import hash_password
+
+    users = get_db().users
+    users.delete_many({'email': {'$regex': r'^bench\d+@load\.samudaya\.test$'}})
+    users.insert_many([{
+        'name': f'Bench User {n}',
+        'email': f'bench{n}@load.samudaya.test',
+        'password': hash_password('password123', offload=False),
+        'role': 'member',
+        'status': 'active',
+    } for n in range(10)])
+
+    app = create_app()
+    if args.sink == '-':
+        sink = sys.stderr
+    elif args.sink:
+        sink = open(args.sink, 'a')
+    else:
+        sink = tempfile.NamedTemporaryFile('a', suffix='.log', delete=False)
+
+    print(f"\n🪵 Login latency, {args.threads} threads, {args.duration}s per mode, logging to {sink.name}\n")
+    print(f"{'mode':<12} {'logins/s':>10} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    try:
+        for mode in args.modes:
+            use_queue, level = MODES[mode]
+            logs._threshold = level
+            logs.configure(output=sink, use_queue=use_queue, force=True)
+            run(app.test_client, args.threads, 0.5)  # warm up
+            latencies = run(app.test_client, args.threads, args.duration)
+            pct = lambda p: latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+            print(f"{mode:<12} {len(latencies) / args.duration:>10.1f} {pct(50):>9.3f} {pct(95):>9.3f} {pct(99):>9.3f}")
+    finally:
+        logs.shutdown()
+        users.delete_many({'email': {'$regex': r'^bench\d+@load\.samudaya\.test$'}})
+    print()
+
+if __name__ == '__main__':
+    main()
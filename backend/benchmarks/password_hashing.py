@@ -0,0 +1,54 @@
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Login verification throughput per core for a given hashing method, inline
+# on request threads (GIL-bound) and offloaded to the process pool.
+#
+#   python benchmarks/password_hashing.py --method scrypt:32768:8:1 --workers 1 2 4
+
+def run(label, verify, stored, threads, duration, cores):
+    deadline = time.time() + duration
+
+    def client():
+        done = 0
+        while time.time() < deadline:
+            verify(stored, 'password123')
+            done += 1
+        return done
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        total = sum(pool.map(lambda _: client(), range(threads)))
+    rate = total / duration
+    print(f"  {label:<18} {rate:>9.1f} logins/s {rate / cores:>9.1f} per core")
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--method', default='scrypt:32768:8:1')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--duration', type=float, default=5)
+    args = parser.parse_args()
+
+    # passwords reads its settings at import time
+    os.environ['PASSWORD_HASH_METHOD'] = args.method
+    import passwords
+    from werkzeug.security import check_password_hash
+
+    stored = passwords.hash_password('password123', offload=False)
+    print(f"\n🔐 {args.method}, {args.threads} request threads, {os.cpu_count()} cores\n")
+    run('inline', check_password_hash, stored, args.threads, args.duration, 1)
+    for workers in args.workers:
+        passwords.PASSWORD_HASH_WORKERS = workers
+        passwords._pool = None
+        passwords.get_pool().submit(int).result()  # warm up the spawned workers
+        run(f'pool x{workers}', passwords.verify_password, stored, args.threads, args.duration, workers)
+        passwords.get_pool().shutdown()
+    print()
+
+if __name__ == '__main__':
+    main()
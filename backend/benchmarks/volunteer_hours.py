@@ -0,0 +1,67 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# volunteer_hours.recompute() (one $group/$merge pass) against the per-user
+# loop it replaces: for each user, sum their completed records and write the
+# total. The loop is timed on a sample of users and extrapolated.
+#
+#   cd backend && python benchmarks/volunteer_hours.py --volunteers 1e6
+#
+# Needs a real mongod ($merge is not available in mongomock).
+
+def parse_count(value):
+    return int(float(value))
+
+def per_user_loop(db, user_ids):
+    for user_id in user_ids:
+        total = sum(
+            record.get('hours') or 0
+            for record in db.volunteers.find({'userId': str(user_id), 'status': 'completed'}, {'hours': 1})
+        )
+        db.users.update_one({'_id': user_id}, {'$set': {'volunteerHours': total}})
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--users', type=parse_count, default=100000)
+    parser.add_argument('--events', type=parse_count, default=10000)
+    parser.add_argument('--volunteers', type=parse_count, default=1000000)
+    parser.add_argument('--sample', type=int, default=2000, help='users timed with the per-user loop')
+    parser.add_argument('--skip-seed', action='store_true', help='reuse data from a previous run')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 4)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    import seed_database
+    import volunteer_hours
+    from database import get_db
+
+    db = get_db()
+    if not args.skip_seed:
+        print(f"🌱 Seeding {args.users} users, {args.events} events, {args.volunteers} volunteer records...")
+        seed_database.clear_collections(db)
+        seed_database.generate(db, argparse.Namespace(
+            users=args.users, events=args.events, announcements=0, threads=0, volunteers=args.volunteers,
+            workers=args.workers, batch_size=1000, seed=args.seed,
+        ))
+
+    records = db.volunteers.estimated_document_count()
+    users = db.users.estimated_document_count()
+    print(f"⏱  {records} volunteer records, {users} users\n")
+
+    written, seconds = volunteer_hours.recompute(db)
+    print(f"{'$group/$merge recompute':<28} {seconds:>9.2f}s  ({written} users written)")
+
+    sample = [doc['_id'] for doc in db.users.find({}, {'_id': 1}).limit(args.sample)]
+    started = time.perf_counter()
+    per_user_loop(db, sample)
+    elapsed = time.perf_counter() - started
+    estimate = elapsed / max(1, len(sample)) * users
+    print(f"{'per-user loop (estimated)':<28} {estimate:>9.2f}s  ({len(sample)} users took {elapsed:.2f}s)")
+    print(f"\n🚀 {estimate / seconds:.1f}x faster\n" if seconds else "")
+
+if __name__ == '__main__':
+    main()
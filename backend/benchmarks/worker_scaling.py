@@ -0,0 +1,74 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+# Load test: start gunicorn with an increasing number of workers and measure
+# throughput of a read endpoint against the configured MongoDB.
+#
+#   cd backend && python benchmarks/worker_scaling.py --workers 1 2 4 8
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def wait_until_up(url, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            urllib.request.urlopen(url, timeout=1).read()
+            return
+        except Exception:
+            time.sleep(0.2)
+    raise RuntimeError(f"Server did not come up at {url}")
+
+def hammer(url, concurrency, duration):
+    deadline = time.time() + duration
+
+    def client():
+        done = errors = 0
+        while time.time() < deadline:
+            try:
+                urllib.request.urlopen(url, timeout=10).read()
+                done += 1
+            except Exception:
+                errors += 1
+        return done, errors
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(lambda _: client(), range(concurrency)))
+    return sum(r[0] for r in results), sum(r[1] for r in results)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--concurrency', type=int, default=64)
+    parser.add_argument('--duration', type=float, default=10)
+    parser.add_argument('--path', default='/api/events?limit=50')
+    parser.add_argument('--port', type=int, default=5055)
+    args = parser.parse_args()
+
+    url = f"http://127.0.0.1:{args.port}{args.path}"
+    print(f"\n🏋️  {url} - {args.concurrency} concurrent clients, {args.duration}s per run\n")
+    print(f"{'workers':>8} {'threads':>8} {'req/s':>10} {'errors':>8}")
+
+    for workers in args.workers:
+        server = subprocess.Popen(
+            [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py',
+             '--workers', str(workers), '--threads', str(args.threads),
+             '--bind', f"127.0.0.1:{args.port}", '--access-logfile', '/dev/null'],
+            cwd=BACKEND_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_until_up(url)
+            done, errors = hammer(url, args.concurrency, args.duration)
+            print(f"{workers:>8} {args.threads:>8} {done / args.duration:>10.1f} {errors:>8}")
+        finally:
+            server.terminate()
+            server.wait()
+    print()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,211 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import wraps
+from flask import request, make_response
+
+# Read-through response cache for list endpoints.
+#
+# Entries are keyed by namespace generation + path + query args. Mutating
+# routes bump the generation of the namespaces they touch, which orphans
+# every cached entry for them at once (orphans age out via TTL/LRU).
+# With the in-process backend each worker has its own cache, so a write only
+# invalidates the worker that handled it and others catch up within the TTL;
+# the redis backend shares entries and generations across workers.
+#
+# Bodies are buffered to compute their ETag, but only up to
+# RESPONSE_CACHE_MAX_ENTRY_BYTES: a streamed list that grows past it (e.g. the
+# unpaginated events list) is passed through uncached and keeps streaming.
+# The in-process backend is bounded by bytes as well as entries, and
+# responses that differ per user (?userId=) bypass the cache entirely.
+
+CACHE_BACKEND = os.getenv('RESPONSE_CACHE_BACKEND', 'memory')
+CACHE_TTL_SECONDS = int(os.getenv('RESPONSE_CACHE_TTL_SECONDS', '30'))
+CACHE_MAX_ENTRIES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '1024'))
+CACHE_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', str(64 * 1024 * 1024)))
+CACHE_MAX_ENTRY_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRY_BYTES', str(1024 * 1024)))
+PER_USER_ARGS = ('userId',)
+REDIS_URL = os.getenv('REDIS_URL', 'redis://localhost:6379/0')
+
+class MemoryCache:
+    # LRU bounded by entries and, when weigh(value) gives sizes, by their sum
+    def __init__(self, max_entries, max_bytes=0, weigh=None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.weigh = weigh
+        self.size = 0
+        self.entries = OrderedDict()
+        self.generations = {}
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value, _ = entry
+            if expires_at < time.monotonic():
+                self._discard(key)
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl):
+        size = self.weigh(value) if self.weigh else 0
+        with self.lock:
+            self._discard(key)
+            if self.max_bytes and size > self.max_bytes:
+                return
+            self.entries[key] = (time.monotonic() + ttl, value, size)
+            self.size += size
+            while len(self.entries) > self.max_entries or (self.max_bytes and self.size > self.max_bytes):
+                self._discard(next(iter(self.entries)))
+
+    def _discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry[2]
+
+    def generation(self, namespace):
+        return self.generations.get(namespace, 0)
+
+    def bump(self, namespace):
+        with self.lock:
+            self.generations[namespace] = self.generations.get(namespace, 0) + 1
+
+class RedisCache:
+    def __init__(self, url):
+        import redis
+        self.client = redis.Redis.from_url(url)
+
+    def get(self, key):
+        raw = self.client.get('samudaya:cache:' + key)
+        if raw is None:
+            return None
+        etag, mimetype, body = raw.split(b'\n', 2)
+        return {'etag': etag.decode(), 'mimetype': mimetype.decode(), 'body': body}
+
+    def set(self, key, value, ttl):
+        raw = b'\n'.join([value['etag'].encode(), value['mimetype'].encode(), value['body']])
+        self.client.set('samudaya:cache:' + key, raw, ex=ttl)
+
+    def generation(self, namespace):
+        return int(self.client.get('samudaya:cache-gen:' + namespace) or 0)
+
+    def bump(self, namespace):
+        self.client.incr('samudaya:cache-gen:' + namespace)
+
+def make_backend():
+    if CACHE_BACKEND == 'off':
+        return None
+    if CACHE_BACKEND == 'redis':
+        try:
+            return RedisCache(REDIS_URL)
+        except ImportError:
+            print("⚠️  RESPONSE_CACHE_BACKEND=redis but the redis package is not installed - using memory cache")
+    return MemoryCache(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, weigh=lambda entry: len(entry['body']))
+
+backend = make_backend()
+
+def make_key(namespace, path, query_args):
+    # Shared with async_app, so both apps read and fill the same entries
+    args = '&'.join(f'{k}={v}' for k, v in sorted(query_args.items(multi=True)))
+    return f'{namespace}:{backend.generation(namespace)}:{path}?{args}'
+
+def cache_key(namespace):
+    return make_key(namespace, request.path, request.args)
+
+def is_per_user(query_args):
+    return any(arg in query_args for arg in PER_USER_ARGS)
+
+def buffer_body(response):
+    # The body if it fits in one entry. Otherwise None, and a streamed
+    # response is left to stream: the chunks read so far are sent first.
+    if not response.is_streamed:
+        body = response.get_data()
+        return body if len(body) <= CACHE_MAX_ENTRY_BYTES else None
+    chunks = []
+    size = 0
+    rest = iter(response.response)
+    for chunk in rest:
+        chunks.append(chunk)
+        size += len(chunk)
+        if size > CACHE_MAX_ENTRY_BYTES:
+            response.response = resume(chunks, rest)
+            return None
+    close_iterator(rest)
+    return b''.join(chunks)
+
+def resume(chunks, rest):
+    try:
+        yield from chunks
+        yield from rest
+    finally:
+        close_iterator(rest)
+
+def close_iterator(iterator):
+    # Runs the generator's cleanup (stream_with_context pops its request context)
+    close = getattr(iterator, 'close', None)
+    if close is not None:
+        close()
+
+def make_entry(body, mimetype):
+    return {'etag': hashlib.sha1(body).hexdigest(), 'mimetype': mimetype, 'body': body}
+
+def conditional(entry):
+    # Clients revalidate with If-None-Match and get an empty 304 when unchanged
+    response = make_response(entry['body'])
+    response.mimetype = entry['mimetype']
+    response.set_etag(entry['etag'])
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
+
+def cached(namespace, ttl=CACHE_TTL_SECONDS):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            if backend is None or is_per_user(request.args):
+                return view(*args, **kwargs)
+            key = cache_key(namespace)
+            entry = backend.get(key)
+            if entry is None:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                body = buffer_body(response)
+                if body is None:
+                    return response
+                entry = make_entry(body, response.mimetype)
+                backend.set(key, entry, ttl)
+            return conditional(entry)
+        return wrapper
+    return decorator
+
+def invalidates(*namespaces):
+    # Bumps the namespaces after any successful (non-error) response
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            response = make_response(view(*args, **kwargs))
+            if backend is not None and response.status_code < 400:
+                for namespace in namespaces:
+                    backend.bump(namespace)
+            return response
+        return wrapper
+    return decorator
+
+def cached_value(namespace, name, compute, ttl=CACHE_TTL_SECONDS):
+    # A JSON-ready value several responses are assembled from (e.g. calendar
+    # month buckets), cached in the same generation as the namespace's lists
+    if backend is None:
+        return compute()
+    key = f'{namespace}:{backend.generation(namespace)}:{name}'
+    entry = backend.get(key)
+    if entry is not None:
+        return json.loads(entry['body'])
+    value = compute()
+    backend.set(key, {'etag': '', 'mimetype': 'application/json', 'body': json.dumps(value).encode()}, ttl)
+    return value
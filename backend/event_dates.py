@@ -0,0 +1,92 @@
+import os
+from datetime import datetime, time, timezone
+from zoneinfo import ZoneInfo
+from pymongo import UpdateOne
+
+# Normalized event start times.
+#
+# Events keep the date ("2025-10-15") and time ("9:00 AM") strings the forms
+# send, which cannot be range-queried. startsAt holds the same moment as a
+# UTC datetime: it is set on every event write and backfilled for older
+# events by migrate_event_dates.py. Strings are read as wall-clock time in
+# EVENT_TIMEZONE; a missing or unreadable time means midnight, an unreadable
+# date leaves startsAt null.
+
+EVENT_TIMEZONE = ZoneInfo(os.getenv('EVENT_TIMEZONE', 'Asia/Kolkata'))
+
+DATE_FORMATS = ('%d/%m/%Y', '%d-%m-%Y', '%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y')
+TIME_FORMATS = ('%I:%M %p', '%I %p', '%H:%M', '%H:%M:%S')
+
+def parse_date(value):
+    value = (value or '').strip()
+    try:
+        # 2025-10-15, or a full ISO datetime
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+    return None
+
+def parse_time(value):
+    # "9:00 AM", "9 am", "9:00a.m.", "18:30"
+    value = (value or '').upper().replace('.', '').strip()
+    if value.endswith(('AM', 'PM')):
+        value = value[:-2].strip() + ' ' + value[-2:]
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).time()
+        except ValueError:
+            continue
+    return None
+
+def starts_at(date_value, time_value):
+    day = parse_date(date_value)
+    if day is None:
+        return None
+    clock = parse_time(time_value) or time()
+    return datetime.combine(day, clock, EVENT_TIMEZONE).astimezone(timezone.utc)
+
+def day_start(day):
+    # UTC moment at which a calendar day starts in EVENT_TIMEZONE
+    return datetime.combine(day, time(), EVENT_TIMEZONE).astimezone(timezone.utc)
+
+def as_utc(moment):
+    # pymongo hands back naive UTC datetimes
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment
+
+def local_day(moment):
+    return as_utc(moment).astimezone(EVENT_TIMEZONE).date()
+
+def months_between(first, last):
+    year, month = first.year, first.month
+    while (year, month) <= (last.year, last.month):
+        yield year, month
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+def month_bounds(year, month):
+    following = (year + 1, 1) if month == 12 else (year, month + 1)
+    return day_start(datetime(year, month, 1).date()), day_start(datetime(*following, 1).date())
+
+def backfill(events, force=False, batch_size=1000, stamp=None):
+    # Sets startsAt on events that do not have it yet (every event with
+    # force). Unreadable dates are stored as null so they are not re-read on
+    # the next run. Returns (updated, unreadable).
+    query = {} if force else {'startsAt': {'$exists': False}}
+    updated = unreadable = 0
+    batch = []
+    for event in events.find(query, {'date': 1, 'time': 1}):
+        value = starts_at(event.get('date'), event.get('time'))
+        if value is None:
+            unreadable += 1
+        fields = {'startsAt': value, **(stamp() if stamp else {})}
+        batch.append(UpdateOne({'_id': event['_id']}, {'$set': fields}))
+        if len(batch) >= batch_size:
+            updated += events.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += events.bulk_write(batch, ordered=False).modified_count
+    return updated, unreadable
@@ -0,0 +1,93 @@
+import csv
+import os
+import re
+from functools import lru_cache
+from pymongo import UpdateOne
+from logs import get_logger
+
+# Offline geocoding for event locations.
+#
+# Locations are free text ("Cubbon Park, Bengaluru"). They are looked up in a
+# local gazetteer (GAZETTEER_PATH, a CSV of name,latitude,longitude): the
+# whole string first, then each comma-separated part from the most specific
+# one, so "Cubbon Park, Bengaluru" resolves to the park and "Koramangala,
+# Bengaluru" at least to the city. Nothing leaves the server; results are
+# memoized per process. Unknown places give None and the event has no point.
+
+GAZETTEER_PATH = os.getenv(
+    'GAZETTEER_PATH', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data', 'gazetteer.csv')
+)
+GEOCODE_CACHE_SIZE = int(os.getenv('GEOCODE_CACHE_SIZE', '4096'))
+
+log = get_logger('geocoding')
+
+def normalize(name):
+    return ' '.join(re.sub(r'[^\w\s]', ' ', name.lower()).split())
+
+_places = None
+
+def places():
+    # {normalized name: (lng, lat)}, read on first use
+    global _places
+    if _places is None:
+        try:
+            with open(GAZETTEER_PATH, newline='', encoding='utf-8') as f:
+                _places = {
+                    normalize(row['name']): (float(row['longitude']), float(row['latitude']))
+                    for row in csv.DictReader(f)
+                }
+        except FileNotFoundError:
+            log.warning('gazetteer_missing', extra={'path': GAZETTEER_PATH})
+            _places = {}
+    return _places
+
+@lru_cache(maxsize=GEOCODE_CACHE_SIZE)
+def lookup(location):
+    gazetteer = places()
+    for candidate in [location, *location.split(',')]:
+        coordinates = gazetteer.get(normalize(candidate))
+        if coordinates:
+            return coordinates
+    return None
+
+def point(lng, lat):
+    return {'type': 'Point', 'coordinates': [lng, lat]}
+
+def geocode(location):
+    if not isinstance(location, str) or not location.strip():
+        return None
+    coordinates = lookup(location.strip())
+    return point(*coordinates) if coordinates else None
+
+def parse_point(value):
+    # Coordinates sent by a client, as {"lat": .., "lng": ..} or a GeoJSON
+    # point. Raises ValueError.
+    try:
+        if value.get('type') == 'Point':
+            lng, lat = (float(c) for c in value['coordinates'])
+        else:
+            lng, lat = float(value['lng']), float(value['lat'])
+    except (AttributeError, KeyError, TypeError, ValueError):
+        raise ValueError('geo must be {"lat": .., "lng": ..} or a GeoJSON Point')
+    if not (-90 <= lat <= 90 and -180 <= lng <= 180):
+        raise ValueError('geo coordinates are out of range')
+    return point(lng, lat)
+
+def backfill(events, batch_size=1000, stamp=None):
+    # Geocodes events that have a location but no point yet. Returns
+    # (updated, unknown); unknown places are retried on the next run, in case
+    # the gazetteer has grown.
+    updated = unknown = 0
+    batch = []
+    for event in events.find({'geo': {'$exists': False}, 'location': {'$nin': [None, '']}}, {'location': 1}):
+        geo = geocode(event['location'])
+        if geo is None:
+            unknown += 1
+            continue
+        batch.append(UpdateOne({'_id': event['_id']}, {'$set': {'geo': geo, **(stamp() if stamp else {})}}))
+        if len(batch) >= batch_size:
+            updated += events.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += events.bulk_write(batch, ordered=False).modified_count
+    return updated, unknown
@@ -0,0 +1,35 @@
+import multiprocessing
+import os
+
+# Production serving for the Flask API: gunicorn -c gunicorn.conf.py
+wsgi_app = 'wsgi:app'
+bind = os.getenv('BIND', f"0.0.0.0:{os.getenv('PORT', '5000')}")
+
+# Requests spend most of their time waiting on MongoDB round trips, so each
+# worker process runs a pool of threads sharing one MongoClient pool
+worker_class = 'gthread'
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', '8'))
+
+# Import the app in each worker after fork (not in the master), so every
+# worker builds its own MongoClient
+preload_app = False
+
+timeout = int(os.getenv('GUNICORN_TIMEOUT', '30'))
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers periodically to bound memory growth
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', '10000'))
+max_requests_jitter = 1000
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+
+def post_fork(server, worker):
+    # Drop any client and log listener inherited from the master if
+    # preload_app is switched on
+    from database import close_client
+    from logs import configure
+    close_client()
+    configure()
@@ -0,0 +1,110 @@
+from pymongo import ASCENDING, DESCENDING, GEOSPHERE, TEXT
+from pymongo.errors import OperationFailure
+from sync import SYNC_TOMBSTONE_TTL_DAYS
+
+# Index manifest: every index the backend's queries rely on, per collection.
+# apply_indexes() is idempotent and runs on app startup and after seeding.
+INDEXES = {
+    'users': [
+        # login / register lookups
+        ([('email', ASCENDING)], {'unique': True}),
+        # reset_password token lookup
+        ([('passwordReset.token', ASCENDING)], {'sparse': True}),
+        # session token revocation map
+        ([('tokenVersion', ASCENDING)], {'sparse': True}),
+        # admin stats reconciliation
+        ([('status', ASCENDING)], {}),
+        ([('joinDate', ASCENDING)], {}),
+    ],
+    'events': [
+        # keyset-paginated listings
+        ([('status', ASCENDING), ('_id', ASCENDING)], {}),
+        ([('status', ASCENDING), ('date', ASCENDING), ('_id', ASCENDING)], {}),
+        # popular events on the admin dashboard
+        ([('status', ASCENDING), ('registered', DESCENDING)], {}),
+        # events created by a user
+        ([('creator', ASCENDING)], {}),
+        # /api/events/nearby (events without a point are left out)
+        ([('geo', GEOSPHERE), ('status', ASCENDING)], {}),
+        # /api/events/calendar month buckets
+        ([('status', ASCENDING), ('startsAt', ASCENDING)], {}),
+        # ?since= delta sync
+        ([('updatedAt', ASCENDING)], {'sparse': True}),
+        # /api/events/search (one text index per collection; weights rank title matches first)
+        ([('title', TEXT), ('tags', TEXT), ('location', TEXT), ('description', TEXT)], {
+            'name': 'event_search',
+            'weights': {'title': 10, 'tags': 5, 'location': 3, 'description': 1},
+        }),
+    ],
+    'registrations': [
+        # one registration per user per event, looked up from either side
+        ([('userId', ASCENDING), ('eventId', ASCENDING)], {'unique': True}),
+        ([('eventId', ASCENDING), ('userId', ASCENDING)], {}),
+    ],
+    'volunteers': [
+        # one signup per user per event; also serves the per-user history
+        ([('userId', ASCENDING), ('eventId', ASCENDING)], {'unique': True}),
+        # roster per event
+        ([('eventId', ASCENDING)], {}),
+        # covers the volunteer_hours.recompute() $group
+        ([('status', ASCENDING), ('userId', ASCENDING), ('hours', ASCENDING)], {}),
+    ],
+    'announcements': [
+        ([('date', DESCENDING)], {}),
+        ([('updatedAt', ASCENDING)], {'sparse': True}),
+    ],
+    'forum_threads': [
+        ([('createdAt', DESCENDING)], {}),
+        ([('updatedAt', ASCENDING)], {'sparse': True}),
+    ],
+    'tombstones': [
+        # deletions since a sync token; expired once no token can need them
+        ([('collection', ASCENDING), ('deletedAt', ASCENDING)], {}),
+        ([('deletedAt', ASCENDING)], {'expireAfterSeconds': SYNC_TOMBSTONE_TTL_DAYS * 86400}),
+    ],
+}
+
+def apply_indexes(db):
+    # Conflicting options or duplicate data are reported rather than fatal
+    # so the API still starts; report_indexes() shows what is missing
+    for collection, specs in INDEXES.items():
+        for keys, options in specs:
+            try:
+                db[collection].create_index(keys, **options)
+            except OperationFailure as e:
+                print(f"⚠️  Could not create index {collection}{keys}: {e}")
+
+def index_key(keys):
+    # Text indexes are stored under the internal _fts/_ftsx key
+    if any(direction == TEXT for _, direction in keys):
+        return (('_fts', 'text'), ('_ftsx', 1))
+    return tuple(keys)
+
+def report_indexes(db):
+    # Compare the manifest against the live indexes and their $indexStats usage
+    report = {}
+    for collection, specs in INDEXES.items():
+        wanted = [index_key(keys) for keys, _ in specs]
+        live = {}
+        for stat in db[collection].aggregate([{'$indexStats': {}}]):
+            live[tuple(stat['key'].items())] = (stat['name'], stat['accesses']['ops'])
+        report[collection] = {
+            'missing': [list(keys) for keys in wanted if keys not in live],
+            'unused': [name for name, ops in live.values() if ops == 0 and name != '_id_'],
+            'unmanaged': [name for keys, (name, _) in live.items() if keys not in wanted and name != '_id_'],
+        }
+    return report
+
+if __name__ == '__main__':
+    import sys
+    from database import db
+
+    if '--report' in sys.argv:
+        for collection, result in report_indexes(db).items():
+            print(f"\n📂 {collection}")
+            for label in ('missing', 'unused', 'unmanaged'):
+                print(f"  {label}: {result[label] or '-'}")
+        print()
+    else:
+        apply_indexes(db)
+        print("✅ Indexes applied")
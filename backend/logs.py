@@ -0,0 +1,162 @@
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import random
+import sys
+import threading
+from datetime import datetime, timezone
+from flask import has_request_context, request
+import metrics
+
+# Structured logging for the request paths.
+#
+# Request threads only build a LogRecord and put it on a bounded in-memory
+# queue (QueueHandler); a per-process QueueListener thread formats it as one
+# JSON line and writes it to stderr. When the queue is full the record is
+# dropped and counted instead of blocking the request.
+#
+# The level can be raised or lowered per route (LOG_ROUTE_LEVELS), and DEBUG
+# records are sampled (LOG_DEBUG_SAMPLE_RATE) so debug logging can stay on
+# for a busy route. Both are decided on the request thread, before queueing.
+#
+#   log = get_logger(__name__)
+#   log.info('login_failed', extra={'email': email, 'reason': 'bad_password'})
+
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+LOG_FORMAT = os.getenv('LOG_FORMAT', 'json')
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', '1.0'))
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+
+def parse_route_levels(value):
+    # "/api/auth/login=DEBUG,/api/events=WARNING" -> {route rule: level}
+    levels = {}
+    for item in filter(None, (part.strip() for part in value.split(','))):
+        route, _, level = item.partition('=')
+        levels[route.strip()] = logging.getLevelName(level.strip().upper())
+    return levels
+
+LOG_ROUTE_LEVELS = parse_route_levels(os.getenv('LOG_ROUTE_LEVELS', ''))
+
+ROOT_LOGGER = 'samudaya'
+
+# Attributes every LogRecord has; anything else came in through extra=
+_RECORD_ATTRS = set(logging.LogRecord('', 0, '', 0, '', (), None).__dict__) | {'message', 'asctime'}
+
+def record_fields(record):
+    return {key: value for key, value in record.__dict__.items() if key not in _RECORD_ATTRS}
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            'level': record.levelname,
+            'logger': record.name,
+            'event': record.getMessage(),
+        }
+        entry.update(record_fields(record))
+        if record.exc_info:
+            entry['exc'] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+class TextFormatter(logging.Formatter):
+    # LOG_FORMAT=text for local development
+    def format(self, record):
+        fields = ' '.join(f'{key}={value}' for key, value in record_fields(record).items())
+        line = f"{self.formatTime(record)} {record.levelname:<7} {record.getMessage()} {fields}".rstrip()
+        if record.exc_info:
+            line += '\n' + self.formatException(record.exc_info)
+        return line
+
+class RequestFilter(logging.Filter):
+    # Runs on the request thread before the record is queued: applies
+    # per-route levels and debug sampling, and tags records with the request
+    def filter(self, record):
+        route = None
+        if has_request_context():
+            route = request.url_rule.rule if request.url_rule else None
+            record.method = request.method
+            record.path = request.path
+            if route:
+                record.route = route
+        threshold = LOG_ROUTE_LEVELS.get(route, _threshold)
+        if record.levelno < threshold:
+            return False
+        if record.levelno <= logging.DEBUG and LOG_DEBUG_SAMPLE_RATE < 1.0:
+            return random.random() < LOG_DEBUG_SAMPLE_RATE
+        return True
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record):
+        # Like QueueHandler.prepare, but keeps a traceback as its own field
+        # instead of folding it into the message
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.exc_text = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            metrics.inc('log_records_dropped_total')
+
+_threshold = logging.getLevelName(LOG_LEVEL)
+_listener = None
+_listener_pid = None
+_lock = threading.Lock()
+
+def make_output_handler(stream=None):
+    handler = logging.StreamHandler(stream or sys.stderr)
+    handler.setFormatter(TextFormatter() if LOG_FORMAT == 'text' else JSONFormatter())
+    return handler
+
+def configure(output=None, use_queue=True, force=False):
+    # Idempotent per process; a forked worker gets its own listener thread.
+    # output/use_queue/force let benchmarks/login_logging.py swap setups.
+    global _listener, _listener_pid
+    with _lock:
+        if _listener_pid == os.getpid() and not force:
+            return
+        if _listener is not None and _listener_pid == os.getpid():
+            _listener.stop()
+        _listener = None
+
+        logger = logging.getLogger(ROOT_LOGGER)
+        for handler in list(logger.handlers):
+            logger.removeHandler(handler)
+        # Lowest level any route asks for; RequestFilter applies the real threshold
+        logger.setLevel(min([_threshold, *LOG_ROUTE_LEVELS.values()]))
+        logger.propagate = False
+
+        output_handler = make_output_handler(output)
+        if use_queue:
+            handler = DroppingQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+            _listener = logging.handlers.QueueListener(handler.queue, output_handler)
+            _listener.start()
+        else:
+            handler = output_handler
+        handler.addFilter(RequestFilter())
+        logger.addHandler(handler)
+        _listener_pid = os.getpid()
+
+def shutdown():
+    # Flushes queued records; registered atexit
+    global _listener
+    with _lock:
+        if _listener is not None and _listener_pid == os.getpid():
+            _listener.stop()
+        _listener = None
+
+atexit.register(shutdown)
+
+def get_logger(name):
+    configure()
+    return logging.getLogger(f'{ROOT_LOGGER}.{name}')
@@ -0,0 +1,153 @@
+import threading
+import time
+from pymongo import monitoring
+
+# Minimal in-process metrics registry rendered in the Prometheus text format
+# by GET /api/_metrics. Values are per worker process.
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+METRICS = {
+    'mongo_pool_connections': ('gauge', 'Open connections in the MongoDB pool'),
+    'mongo_pool_in_use': ('gauge', 'Connections currently checked out of the pool'),
+    'mongo_pool_max_size': ('gauge', 'Configured maxPoolSize'),
+    'mongo_pool_checkout_wait_seconds': ('histogram', 'Time spent waiting to check out a connection'),
+    'mongo_pool_checkout_failures_total': ('counter', 'Failed connection checkouts by reason'),
+    'mongo_pool_cleared_total': ('counter', 'Times the pool was cleared'),
+    'mongo_command_duration_seconds': ('histogram', 'MongoDB command latency by command name'),
+    'mongo_command_failures_total': ('counter', 'Failed MongoDB commands by command name'),
+    'http_requests_total': ('counter', 'Requests by route, method and status'),
+    'http_request_duration_seconds': ('histogram', 'Request wall time, including streamed bodies'),
+    'http_request_db_seconds': ('histogram', 'Time per request spent in MongoDB commands'),
+    'http_request_serialize_seconds': ('histogram', 'Time per request spent encoding JSON'),
+    'http_request_mongo_commands_total': ('counter', 'MongoDB commands issued by requests, by route'),
+    'log_records_dropped_total': ('counter', 'Log records dropped because the log queue was full'),
+    'push_subscribers': ('gauge', 'Open /api/stream connections'),
+    'push_events_total': ('counter', 'Pushed update events by topic'),
+    'push_subscribers_dropped_total': ('counter', 'Stream clients disconnected for falling behind'),
+}
+
+_lock = threading.Lock()
+_values = {}
+_histograms = {}
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+def inc(name, amount=1, **labels):
+    key = _key(name, labels)
+    with _lock:
+        _values[key] = _values.get(key, 0) + amount
+
+def set_value(name, value, **labels):
+    with _lock:
+        _values[_key(name, labels)] = value
+
+def observe(name, value, **labels):
+    key = _key(name, labels)
+    with _lock:
+        hist = _histograms.get(key)
+        if hist is None:
+            hist = _histograms[key] = {'buckets': [0] * len(LATENCY_BUCKETS), 'sum': 0.0, 'count': 0}
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if value <= bound:
+                hist['buckets'][i] += 1
+        hist['sum'] += value
+        hist['count'] += 1
+
+def _labels(pairs, extra=()):
+    pairs = list(pairs) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{k}="{v}"' for k, v in pairs) + '}'
+
+def render():
+    with _lock:
+        values = dict(_values)
+        histograms = {key: dict(hist, buckets=list(hist['buckets'])) for key, hist in _histograms.items()}
+
+    lines = []
+    for name, (kind, help_text) in METRICS.items():
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} {kind}')
+        if kind == 'histogram':
+            for (metric, labels), hist in sorted(histograms.items()):
+                if metric != name:
+                    continue
+                for bound, count in zip(LATENCY_BUCKETS, hist['buckets']):
+                    lines.append(f'{name}_bucket{_labels(labels, [("le", bound)])} {count}')
+                lines.append(f'{name}_bucket{_labels(labels, [("le", "+Inf")])} {hist["count"]}')
+                lines.append(f'{name}_sum{_labels(labels)} {hist["sum"]}')
+                lines.append(f'{name}_count{_labels(labels)} {hist["count"]}')
+        else:
+            for (metric, labels), value in sorted(values.items()):
+                if metric == name:
+                    lines.append(f'{name}{_labels(labels)} {value}')
+    return '\n'.join(lines) + '\n'
+
+# ==================== PYMONGO LISTENERS ====================
+
+class PoolMetrics(monitoring.ConnectionPoolListener):
+    # CMAP events: pool size, connections in use and checkout wait time.
+    # Checkouts happen synchronously on the requesting thread, so the start
+    # time is kept thread-local.
+    def __init__(self):
+        self._checkout = threading.local()
+
+    def _address(self, event):
+        return '%s:%s' % event.address
+
+    def _wait(self, event):
+        started = getattr(self._checkout, 'started', None)
+        if started is not None:
+            observe('mongo_pool_checkout_wait_seconds', time.perf_counter() - started, address=self._address(event))
+            self._checkout.started = None
+
+    def pool_created(self, event):
+        max_size = event.options.get('maxPoolSize')
+        if max_size is not None:
+            set_value('mongo_pool_max_size', max_size, address=self._address(event))
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        inc('mongo_pool_cleared_total', address=self._address(event))
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        inc('mongo_pool_connections', address=self._address(event))
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        inc('mongo_pool_connections', -1, address=self._address(event))
+
+    def connection_check_out_started(self, event):
+        self._checkout.started = time.perf_counter()
+
+    def connection_check_out_failed(self, event):
+        self._wait(event)
+        inc('mongo_pool_checkout_failures_total', address=self._address(event), reason=event.reason)
+
+    def connection_checked_out(self, event):
+        self._wait(event)
+        inc('mongo_pool_in_use', address=self._address(event))
+
+    def connection_checked_in(self, event):
+        inc('mongo_pool_in_use', -1, address=self._address(event))
+
+class CommandMetrics(monitoring.CommandListener):
+    # Per-command latency as reported by the driver
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        observe('mongo_command_duration_seconds', event.duration_micros / 1e6, command=event.command_name)
+
+    def failed(self, event):
+        observe('mongo_command_duration_seconds', event.duration_micros / 1e6, command=event.command_name)
+        inc('mongo_command_failures_total', command=event.command_name)
@@ -0,0 +1,24 @@
+import sys
+from database import db
+from indexes import apply_indexes
+import event_dates
+import sync
+
+# Backfill startsAt (see event_dates.py) from the free-form date/time strings
+# of existing events. Safe to re-run: only events without startsAt are read,
+# unless --force is given (e.g. after changing EVENT_TIMEZONE).
+
+print("\n" + "="*60)
+print("🗓  BACKFILLING EVENT START TIMES")
+print("="*60 + "\n")
+
+apply_indexes(db)
+
+# updatedAt too, so ?since= clients pick up the new field
+updated, unreadable = event_dates.backfill(db.events, force='--force' in sys.argv, stamp=sync.stamp)
+
+print(f"✅ Events updated: {updated}")
+if unreadable:
+    print(f"⚠️  {unreadable} events have a date that could not be read; their startsAt is null")
+    print("   They stay out of /api/events/calendar until the date is fixed.")
+print()
@@ -0,0 +1,22 @@
+from database import db
+from indexes import apply_indexes
+import geocoding
+import sync
+
+# Geocode existing events from their location text (see geocoding.py) so
+# they show up in /api/events/nearby. Safe to re-run: events that already
+# have a point are skipped, unknown places are tried again.
+
+print("\n" + "="*60)
+print("📍 GEOCODING EVENT LOCATIONS")
+print("="*60 + "\n")
+
+apply_indexes(db)
+
+updated, unknown = geocoding.backfill(db.events, stamp=sync.stamp)
+
+print(f"✅ Events geocoded: {updated}")
+if unknown:
+    print(f"⚠️  {unknown} events have a location that is not in {geocoding.GAZETTEER_PATH}")
+    print("   Add the places to the gazetteer and run this again to include them.")
+print()
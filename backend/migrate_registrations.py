@@ -0,0 +1,36 @@
+from datetime import datetime
+from database import db
+from indexes import apply_indexes
+
+# Backfill the registrations collection from the registeredUsers arrays
+# embedded in event documents. Safe to re-run: existing pairs are kept.
+
+print("\n" + "="*60)
+print("🔁 BACKFILLING EVENT REGISTRATIONS")
+print("="*60 + "\n")
+
+apply_indexes(db)
+
+before = db.registrations.count_documents({})
+
+# A single server-side pass: unwind every registrant and merge on the
+# unique (userId, eventId) pair instead of round-tripping each one
+db.events.aggregate([
+    {'$match': {'registeredUsers.0': {'$exists': True}}},
+    {'$unwind': '$registeredUsers'},
+    {'$project': {
+        '_id': 0,
+        'userId': '$registeredUsers',
+        'eventId': {'$toString': '$_id'},
+        'registeredAt': {'$ifNull': ['$createdAt', datetime.now().isoformat()]},
+    }},
+    {'$merge': {
+        'into': 'registrations',
+        'on': ['userId', 'eventId'],
+        'whenMatched': 'keepExisting',
+        'whenNotMatched': 'insert',
+    }},
+])
+
+after = db.registrations.count_documents({})
+print(f"✅ Registrations: {before} -> {after} ({after - before} backfilled)\n")
@@ -0,0 +1,75 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+from functools import lru_cache
+from werkzeug.security import generate_password_hash, check_password_hash
+
+# Password hashing is CPU-bound (tens to hundreds of ms per call), so it runs
+# in a small process pool: the request thread only waits on a future with
+# the GIL released and other requests keep flowing. The pool is bounded;
+# when too many hashes are queued callers get HashingBusy instead of piling up.
+
+# Any werkzeug method string, e.g. scrypt:32768:8:1 or pbkdf2:sha256:600000
+PASSWORD_HASH_METHOD = os.getenv('PASSWORD_HASH_METHOD', 'scrypt:32768:8:1')
+# 0 hashes inline on the request thread
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', '2'))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv('PASSWORD_HASH_MAX_PENDING', '64'))
+PASSWORD_HASH_TIMEOUT_SECONDS = float(os.getenv('PASSWORD_HASH_TIMEOUT_SECONDS', '5'))
+
+class HashingBusy(Exception):
+    pass
+
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+_pending = threading.BoundedSemaphore(PASSWORD_HASH_MAX_PENDING)
+
+def get_pool():
+    # Per process, like the MongoClient: a forked gunicorn worker gets its own
+    global _pool, _pool_pid
+    if _pool is None or _pool_pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool_pid != os.getpid():
+                _pool = ProcessPoolExecutor(
+                    max_workers=PASSWORD_HASH_WORKERS,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+                _pool_pid = os.getpid()
+    return _pool
+
+def _run(fn, *args):
+    if PASSWORD_HASH_WORKERS <= 0:
+        return fn(*args)
+    if not _pending.acquire(timeout=PASSWORD_HASH_TIMEOUT_SECONDS):
+        raise HashingBusy('Too many password operations in progress')
+    try:
+        future = get_pool().submit(fn, *args)
+        try:
+            return future.result(timeout=PASSWORD_HASH_TIMEOUT_SECONDS)
+        except FutureTimeout:
+            # Queued behind other hashes for too long; drop it if it has not started
+            future.cancel()
+            raise HashingBusy('Password hashing timed out')
+    finally:
+        _pending.release()
+
+def _hash(password, method):
+    return generate_password_hash(password, method=method)
+
+def hash_password(password, offload=True):
+    if not offload:
+        return _hash(password, PASSWORD_HASH_METHOD)
+    return _run(_hash, password, PASSWORD_HASH_METHOD)
+
+def verify_password(stored_hash, password):
+    return _run(check_password_hash, stored_hash, password)
+
+@lru_cache(maxsize=1)
+def current_method():
+    # Normalised form of the configured method ("scrypt" -> "scrypt:32768:8:1")
+    return _hash('', PASSWORD_HASH_METHOD).split('$', 1)[0]
+
+def needs_rehash(stored_hash):
+    # werkzeug hashes look like "<method>$<salt>$<hash>"
+    return stored_hash.split('$', 1)[0] != current_method()
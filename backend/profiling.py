@@ -0,0 +1,176 @@
+import os
+import threading
+import time
+from flask import request, g
+from pymongo import monitoring
+import metrics
+from logs import get_logger
+
+# Per-request instrumentation for the Flask app.
+#
+# Every request records its wall time, the MongoDB commands it issued (via a
+# command listener, attributed through a thread-local - gthread workers serve
+# a request, including a streamed body, on one thread) and the time spent
+# encoding JSON. Totals go to /api/_metrics per route; the work done before
+# the response starts is also sent back as a Server-Timing header, and
+# requests slower than SLOW_REQUEST_MS are logged with every command.
+#
+# With REQUEST_PROFILING=true a request carrying "X-Profile: pyinstrument" or
+# "X-Profile: cprofile" is profiled; the report is written to PROFILE_DIR and
+# its path returned in the X-Profile-Report header.
+
+REQUEST_TIMING = os.getenv('REQUEST_TIMING', 'true').lower() == 'true'
+SLOW_REQUEST_MS = float(os.getenv('SLOW_REQUEST_MS', '500'))
+REQUEST_PROFILING = os.getenv('REQUEST_PROFILING', 'false').lower() == 'true'
+PROFILE_DIR = os.getenv('PROFILE_DIR', '/tmp/samudaya-profiles')
+# Commands kept per request for the slow log (all are counted)
+MAX_RECORDED_COMMANDS = 200
+
+log = get_logger('profiling')
+
+_local = threading.local()
+
+class RequestProfile:
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.command_count = 0
+        self.db_seconds = 0.0
+        self.serialize_seconds = 0.0
+        self.commands = []
+        self.pending = {}
+
+def current():
+    return getattr(_local, 'profile', None)
+
+def add_serialize_time(seconds):
+    profile = current()
+    if profile is not None:
+        profile.serialize_seconds += seconds
+
+class CommandTimings(monitoring.CommandListener):
+    def started(self, event):
+        profile = current()
+        if profile is not None:
+            # The collection name is only on the command document
+            target = event.command.get(event.command_name)
+            profile.pending[event.request_id] = target if isinstance(target, str) else ''
+
+    def _finish(self, event, ok):
+        profile = current()
+        if profile is None:
+            return
+        seconds = event.duration_micros / 1e6
+        profile.command_count += 1
+        profile.db_seconds += seconds
+        target = profile.pending.pop(event.request_id, '')
+        if len(profile.commands) < MAX_RECORDED_COMMANDS:
+            profile.commands.append((event.command_name, target, seconds, ok))
+
+    def succeeded(self, event):
+        self._finish(event, True)
+
+    def failed(self, event):
+        self._finish(event, False)
+
+# ==================== PROFILER ====================
+
+def start_profiler(kind):
+    if kind == 'cprofile':
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+        return profiler
+    if kind == 'pyinstrument':
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            log.warning('profiler_unavailable', extra={'profiler': kind})
+            return None
+        profiler = Profiler()
+        profiler.start()
+        return profiler
+    return None
+
+def save_profile(profiler):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    name = f"{time.strftime('%Y%m%d-%H%M%S')}-{request.method}-{request.path.strip('/').replace('/', '_')}"
+    if hasattr(profiler, 'output_html'):
+        profiler.stop()
+        path = os.path.join(PROFILE_DIR, name + '.html')
+        with open(path, 'w') as f:
+            f.write(profiler.output_html())
+    else:
+        profiler.disable()
+        path = os.path.join(PROFILE_DIR, name + '.prof')
+        profiler.dump_stats(path)
+    return path
+
+# ==================== REQUEST HOOKS ====================
+
+def route_label():
+    return request.url_rule.rule if request.url_rule else 'unmatched'
+
+def server_timing(profile):
+    total = (time.perf_counter() - profile.started) * 1000
+    return (
+        f'db;dur={profile.db_seconds * 1000:.1f};desc="{profile.command_count} commands", '
+        f'serialize;dur={profile.serialize_seconds * 1000:.1f}, '
+        f'total;dur={total:.1f}'
+    )
+
+def log_slow_request(route, method, path, status, profile, elapsed):
+    # Called after the response is sent, so outside the request context
+    log.warning('slow_request', extra={
+        'route': route,
+        'method': method,
+        'path': path,
+        'status': status,
+        'duration_ms': round(elapsed * 1000, 1),
+        'db_ms': round(profile.db_seconds * 1000, 1),
+        'serialize_ms': round(profile.serialize_seconds * 1000, 1),
+        'command_count': profile.command_count,
+        'commands': [
+            {'command': name, 'collection': target, 'ms': round(seconds * 1000, 2), 'ok': ok}
+            for name, target, seconds, ok in profile.commands
+        ],
+    })
+
+def before_request():
+    _local.profile = RequestProfile()
+    g.profiler = None
+    if REQUEST_PROFILING and 'X-Profile' in request.headers:
+        g.profiler = start_profiler(request.headers['X-Profile'].lower())
+
+def after_request(response):
+    profile = current()
+    if profile is None:
+        return response
+    if response.mimetype == 'text/event-stream':
+        # Update streams stay open indefinitely; not a request to time
+        _local.profile = None
+        return response
+    if g.get('profiler') is not None:
+        response.headers['X-Profile-Report'] = save_profile(g.profiler)
+    response.headers['Server-Timing'] = server_timing(profile)
+    response.headers['Timing-Allow-Origin'] = '*'
+
+    # Streamed bodies keep querying after this point; the totals are
+    # recorded once the response has been sent
+    route, method, path, status = route_label(), request.method, request.path, response.status_code
+    def finish():
+        elapsed = time.perf_counter() - profile.started
+        metrics.inc('http_requests_total', route=route, method=method, status=status)
+        metrics.observe('http_request_duration_seconds', elapsed, route=route, method=method)
+        metrics.observe('http_request_db_seconds', profile.db_seconds, route=route, method=method)
+        metrics.observe('http_request_serialize_seconds', profile.serialize_seconds, route=route, method=method)
+        metrics.inc('http_request_mongo_commands_total', profile.command_count, route=route, method=method)
+        if SLOW_REQUEST_MS and elapsed * 1000 >= SLOW_REQUEST_MS:
+            log_slow_request(route, method, path, status, profile, elapsed)
+        _local.profile = None
+    response.call_on_close(finish)
+    return response
+
+def init_app(app):
+    if REQUEST_TIMING:
+        app.before_request(before_request)
+        app.after_request(after_request)
@@ -0,0 +1,300 @@
+import asyncio
+import json
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from pymongo.errors import PyMongoError
+from json_provider import bson_default
+from logs import get_logger
+import metrics
+
+# Push channel for list updates (GET /api/stream, server-sent events).
+#
+# Small deltas - a new or deleted announcement, a new/deleted/pinned forum
+# thread, an approved or rejected event - are fanned out to every connected
+# client, so pages can apply them instead of re-fetching whole lists.
+#
+# Source: a MongoDB change stream watched by each worker process (needs a
+# replica set; Atlas always is one), which also covers writes handled by
+# other workers. Without change streams, routes publish their own writes
+# in-process via notify(), which only reaches clients of the same worker.
+#
+# Each event has an id "<process>:<seq>"; a reconnecting client sends it back
+# in Last-Event-ID and gets the missed events replayed from a short backlog,
+# or a "resync" event telling it to re-fetch when that is not possible.
+
+PUSH_ENABLED = os.getenv('PUSH_ENABLED', 'true').lower() == 'true'
+# auto: change streams when the deployment supports them, else in-process
+PUSH_SOURCE = os.getenv('PUSH_SOURCE', 'auto')
+PUSH_MAX_SUBSCRIBERS = int(os.getenv('PUSH_MAX_SUBSCRIBERS', '100'))
+# A stream served by the Flask app holds a gunicorn thread while it is open;
+# by default at most half of a worker's threads, so ordinary requests still
+# get served (async_app streams are only bounded by PUSH_MAX_SUBSCRIBERS)
+PUSH_MAX_THREAD_SUBSCRIBERS = int(os.getenv(
+    'PUSH_MAX_THREAD_SUBSCRIBERS', str(max(1, int(os.getenv('GUNICORN_THREADS', '8')) // 2))
+))
+PUSH_HEARTBEAT_SECONDS = float(os.getenv('PUSH_HEARTBEAT_SECONDS', '15'))
+PUSH_BACKLOG = int(os.getenv('PUSH_BACKLOG', '500'))
+PUSH_SUBSCRIBER_QUEUE = int(os.getenv('PUSH_SUBSCRIBER_QUEUE', '100'))
+
+TOPICS = ('announcements', 'forum', 'events')
+
+log = get_logger('push')
+
+class TooManySubscribers(Exception):
+    pass
+
+def encode(data):
+    return json.dumps(data, default=bson_default, separators=(',', ':'), ensure_ascii=False)
+
+class Subscriber:
+    # Blocking consumer for a Flask worker thread
+    holds_thread = True
+
+    def __init__(self, topics):
+        self.topics = topics
+        self.queue = queue.Queue(PUSH_SUBSCRIBER_QUEUE)
+
+    def deliver(self, event):
+        # Called with the broker lock held; False drops the subscriber
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except queue.Full:
+            return False
+
+    def close(self):
+        try:
+            self.queue.put_nowait(None)
+        except queue.Full:
+            pass
+
+    def get(self, timeout):
+        try:
+            return self.queue.get(timeout=timeout)
+        except queue.Empty:
+            return 'heartbeat'
+
+class AsyncSubscriber(Subscriber):
+    # Consumer for the Quart app: events are handed to its event loop
+    holds_thread = False
+
+    def __init__(self, topics):
+        self.topics = topics
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(PUSH_SUBSCRIBER_QUEUE)
+
+    def deliver(self, event):
+        if self.queue.qsize() >= PUSH_SUBSCRIBER_QUEUE - 1:
+            return False
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
+        return True
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.queue.put_nowait, None)
+
+    async def get(self, timeout):
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return 'heartbeat'
+
+class Broker:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.subscribers = set()
+        self.backlog = deque(maxlen=PUSH_BACKLOG)
+        self.process = uuid.uuid4().hex[:8]
+        self.seq = 0
+
+    def check_capacity(self, holds_thread):
+        if len(self.subscribers) >= PUSH_MAX_SUBSCRIBERS:
+            raise TooManySubscribers('Too many open update streams')
+        if holds_thread and sum(s.holds_thread for s in self.subscribers) >= PUSH_MAX_THREAD_SUBSCRIBERS:
+            raise TooManySubscribers('Too many open update streams')
+
+    def subscribe(self, subscriber):
+        with self.lock:
+            self.check_capacity(subscriber.holds_thread)
+            self.subscribers.add(subscriber)
+            metrics.set_value('push_subscribers', len(self.subscribers))
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        with self.lock:
+            self.subscribers.discard(subscriber)
+            metrics.set_value('push_subscribers', len(self.subscribers))
+
+    def publish(self, topic, name, data):
+        self.publish_many(topic, name, [data])
+
+    def publish_many(self, topic, name, items):
+        # One event per item, under a single lock acquisition
+        with self.lock:
+            for data in items:
+                self.seq += 1
+                # Serialized once, shared by every subscriber
+                event = (self.seq, topic, f'id: {self.process}:{self.seq}\nevent: {name}\ndata: {encode(data)}\n\n')
+                self.backlog.append(event)
+                for subscriber in list(self.subscribers):
+                    if topic in subscriber.topics and not subscriber.deliver(event):
+                        # Too slow to keep up: disconnect, the client resyncs
+                        self.subscribers.discard(subscriber)
+                        subscriber.close()
+                        metrics.inc('push_subscribers_dropped_total')
+            metrics.inc('push_events_total', len(items), topic=topic)
+
+    def replay(self, last_event_id, topics):
+        # Events after last_event_id, or None if they are no longer known
+        process, _, seq = (last_event_id or '').partition(':')
+        if process != self.process or not seq.isdigit():
+            return None
+        with self.lock:
+            if self.backlog and self.backlog[0][0] > int(seq) + 1:
+                return None
+            return [event for event in self.backlog if event[0] > int(seq) and event[1] in topics]
+
+broker = Broker()
+
+RESYNC = 'event: resync\ndata: {}\n\n'
+
+def parse_topics(value):
+    topics = {topic for topic in (value or ','.join(TOPICS)).split(',') if topic in TOPICS}
+    return topics or set(TOPICS)
+
+def opening(subscriber, last_event_id):
+    # Retry hint, then whatever the client missed while reconnecting
+    chunks = ['retry: 3000\n\n']
+    last_seq = 0
+    if last_event_id:
+        missed = broker.replay(last_event_id, subscriber.topics)
+        if missed is None:
+            chunks.append(RESYNC)
+        else:
+            chunks.extend(event[2] for event in missed)
+            last_seq = missed[-1][0] if missed else int(last_event_id.partition(':')[2])
+    return chunks, last_seq
+
+# The stream functions raise TooManySubscribers up front so the route can
+# answer 503; the subscription itself starts with the body, so a response
+# that is never sent cannot leak one
+
+def event_stream(topics, last_event_id):
+    broker.check_capacity(Subscriber.holds_thread)
+
+    def generate():
+        subscriber = broker.subscribe(Subscriber(topics))
+        try:
+            chunks, last_seq = opening(subscriber, last_event_id)
+            yield ''.join(chunks)
+            while True:
+                event = subscriber.get(PUSH_HEARTBEAT_SECONDS)
+                if event is None:
+                    yield RESYNC
+                    return
+                if event == 'heartbeat':
+                    # Also how a closed connection is noticed
+                    yield ': keepalive\n\n'
+                elif event[0] > last_seq:
+                    yield event[2]
+        finally:
+            broker.unsubscribe(subscriber)
+
+    return generate()
+
+def async_event_stream(topics, last_event_id):
+    broker.check_capacity(AsyncSubscriber.holds_thread)
+
+    async def generate():
+        subscriber = broker.subscribe(AsyncSubscriber(topics))
+        try:
+            chunks, last_seq = opening(subscriber, last_event_id)
+            yield ''.join(chunks).encode()
+            while True:
+                event = await subscriber.get(PUSH_HEARTBEAT_SECONDS)
+                if event is None:
+                    yield RESYNC.encode()
+                    return
+                if event == 'heartbeat':
+                    yield b': keepalive\n\n'
+                elif event[0] > last_seq:
+                    yield event[2].encode()
+        finally:
+            broker.unsubscribe(subscriber)
+
+    return generate()
+
+# ==================== SOURCES ====================
+
+_changestream_active = False
+
+def notify(topic, name, data):
+    # Called by routes after a write; redundant when the change stream is
+    # delivering the same change
+    if PUSH_ENABLED and not _changestream_active:
+        broker.publish(topic, name, data)
+
+def notify_many(topic, name, items):
+    # Batch variant for the bulk admin routes
+    if PUSH_ENABLED and not _changestream_active and items:
+        broker.publish_many(topic, name, items)
+
+def change_to_delta(change):
+    collection = change['ns']['coll']
+    operation = change['operationType']
+    doc_id = str(change['documentKey']['_id'])
+    updated = change.get('updateDescription', {}).get('updatedFields', {})
+
+    if collection == 'announcements':
+        if operation == 'insert':
+            return 'announcements', 'announcement.created', change['fullDocument']
+        if operation == 'delete':
+            return 'announcements', 'announcement.deleted', {'_id': doc_id}
+    elif collection == 'forum_threads':
+        if operation == 'insert':
+            return 'forum', 'thread.created', change['fullDocument']
+        if operation == 'delete':
+            return 'forum', 'thread.deleted', {'_id': doc_id}
+        if operation == 'update' and updated.get('isPinned') is True:
+            return 'forum', 'thread.pinned', {'_id': doc_id}
+    elif collection == 'events':
+        if operation == 'update' and updated.get('status') == 'published':
+            return 'events', 'event.approved', {'_id': doc_id, 'status': 'published'}
+        if operation == 'update' and updated.get('status') == 'rejected':
+            return 'events', 'event.rejected', {'_id': doc_id, 'status': 'rejected'}
+    return None
+
+CHANGE_PIPELINE = [{'$match': {
+    'ns.coll': {'$in': ['announcements', 'forum_threads', 'events']},
+    'operationType': {'$in': ['insert', 'update', 'delete']},
+}}]
+
+def watch_changes(db):
+    global _changestream_active
+    resume_token = None
+    while True:
+        try:
+            with db.watch(CHANGE_PIPELINE, resume_after=resume_token) as stream:
+                if not _changestream_active:
+                    _changestream_active = True
+                    log.info('push_source', extra={'source': 'changestream'})
+                for change in stream:
+                    resume_token = stream.resume_token
+                    delta = change_to_delta(change)
+                    if delta:
+                        broker.publish(*delta)
+        except PyMongoError as e:
+            if not _changestream_active and PUSH_SOURCE == 'auto':
+                # Standalone server: routes publish their writes instead
+                log.info('push_source', extra={'source': 'in-process', 'reason': str(e)})
+                return
+            log.warning('push_changestream_error', extra={'error': str(e)})
+            time.sleep(1)
+
+def start(db):
+    if not PUSH_ENABLED or PUSH_SOURCE == 'local':
+        return
+    threading.Thread(target=watch_changes, args=(db,), name='push-changestream', daemon=True).start()
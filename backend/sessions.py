@@ -0,0 +1,124 @@
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+from functools import wraps
+from flask import request, g, jsonify
+from pymongo import ReturnDocument
+from cache import MemoryCache
+from database import collection
+
+# Stateless session tokens (JWT, HS256) issued by login. Verified claims are
+# kept in a bounded LRU, so authorizing a request - including the admin
+# routes - needs no database round trip.
+#
+# Revocation: every user has a tokenVersion counter that is embedded in
+# their tokens and bumped on password/role/status changes and logout. Each
+# worker keeps the compact {userId: tokenVersion} map of users that have
+# ever been revoked and refreshes it at most every
+# TOKEN_REVOCATION_REFRESH_SECONDS.
+
+SESSION_SECRET = os.getenv('SESSION_SECRET')
+if not SESSION_SECRET:
+    print("⚠️  WARNING: SESSION_SECRET not set - using a random per-process secret.")
+    print("   Tokens will not survive restarts or work across gunicorn workers.")
+    SESSION_SECRET = secrets.token_hex(32)
+
+SESSION_TOKEN_TTL_SECONDS = int(os.getenv('SESSION_TOKEN_TTL_SECONDS', str(12 * 3600)))
+TOKEN_CACHE_SIZE = int(os.getenv('TOKEN_CACHE_SIZE', '4096'))
+TOKEN_REVOCATION_REFRESH_SECONDS = int(os.getenv('TOKEN_REVOCATION_REFRESH_SECONDS', '30'))
+
+users = collection('users')
+
+_claims_cache = MemoryCache(TOKEN_CACHE_SIZE)
+_versions = {}
+_versions_loaded_at = 0
+_versions_lock = threading.Lock()
+
+def _b64encode(raw):
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def _b64decode(text):
+    return base64.urlsafe_b64decode(text + '=' * (-len(text) % 4))
+
+def _sign(message):
+    return _b64encode(hmac.new(SESSION_SECRET.encode(), message.encode(), hashlib.sha256).digest())
+
+def issue_token(user):
+    now = int(time.time())
+    header = _b64encode(b'{"alg":"HS256","typ":"JWT"}')
+    payload = _b64encode(json.dumps({
+        'sub': str(user['_id']),
+        'role': user.get('role', 'member'),
+        'ver': user.get('tokenVersion', 0),
+        'iat': now,
+        'exp': now + SESSION_TOKEN_TTL_SECONDS,
+    }, separators=(',', ':')).encode())
+    message = f'{header}.{payload}'
+    return f'{message}.{_sign(message)}'
+
+def token_versions():
+    global _versions, _versions_loaded_at
+    if time.monotonic() - _versions_loaded_at > TOKEN_REVOCATION_REFRESH_SECONDS:
+        with _versions_lock:
+            if time.monotonic() - _versions_loaded_at > TOKEN_REVOCATION_REFRESH_SECONDS:
+                _versions = {
+                    str(doc['_id']): doc['tokenVersion']
+                    for doc in users.find({'tokenVersion': {'$gt': 0}}, {'tokenVersion': 1})
+                }
+                _versions_loaded_at = time.monotonic()
+    return _versions
+
+def decode_token(token):
+    claims = _claims_cache.get(token)
+    if claims is None:
+        try:
+            message, signature = token.rsplit('.', 1)
+            # As bytes: compare_digest rejects non-ASCII str
+            if not hmac.compare_digest(signature.encode(), _sign(message).encode()):
+                return None
+            claims = json.loads(_b64decode(message.split('.', 1)[1]))
+        except (ValueError, IndexError):
+            return None
+        ttl = claims.get('exp', 0) - time.time()
+        if ttl <= 0:
+            return None
+        _claims_cache.set(token, claims, ttl)
+    if claims['exp'] <= time.time():
+        return None
+    if claims.get('ver', 0) < token_versions().get(claims['sub'], 0):
+        return None
+    return claims
+
+def load_claims():
+    # Registered as a before_request hook: g.claims is None for anonymous
+    # requests or invalid/expired/revoked tokens
+    header = request.headers.get('Authorization', '')
+    g.claims = decode_token(header[7:]) if header.startswith('Bearer ') else None
+
+def revoke_user_tokens(user_id):
+    # Invalidates every token issued to the user so far
+    doc = users.find_one_and_update(
+        {'_id': user_id}, {'$inc': {'tokenVersion': 1}},
+        projection={'tokenVersion': 1}, return_document=ReturnDocument.AFTER
+    )
+    if doc:
+        with _versions_lock:
+            _versions[str(user_id)] = doc['tokenVersion']
+
+def require_role(*roles):
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            claims = g.get('claims')
+            if not claims:
+                return jsonify({'error': 'Authentication required'}), 401
+            if roles and claims.get('role') not in roles:
+                return jsonify({'error': 'Forbidden'}), 403
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
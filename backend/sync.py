@@ -0,0 +1,76 @@
+import base64
+import json
+import os
+from datetime import datetime, timedelta, timezone
+from database import collection
+
+# Delta sync for the list endpoints (?since=<token>).
+#
+# Every mutating route stamps updatedAt on the documents it touches and every
+# delete leaves a tombstone, so a returning client can ask for just what
+# changed after its last sync:
+#
+#   GET /api/announcements?since=            -> full snapshot + token
+#   GET /api/announcements?since=<token>     -> {changed, deleted, nextSince, reset}
+#
+# Tokens carry a timestamp. Workers stamp with their own clock and a write
+# may commit after a concurrent sync has read, so each token reaches back
+# SYNC_OVERLAP_SECONDS; clients apply changes by _id, so repeats are harmless.
+# Tombstones expire after SYNC_TOMBSTONE_TTL_DAYS - older tokens get a full
+# snapshot with reset=true.
+
+SYNC_OVERLAP_SECONDS = int(os.getenv('SYNC_OVERLAP_SECONDS', '5'))
+SYNC_TOMBSTONE_TTL_DAYS = int(os.getenv('SYNC_TOMBSTONE_TTL_DAYS', '30'))
+
+tombstones = collection('tombstones')
+
+def now():
+    return datetime.now(timezone.utc)
+
+def stamp(fields=None):
+    # $set document (or update-pipeline $set stage) body marking a change
+    return {**(fields or {}), 'updatedAt': now()}
+
+def record_deletions(collection_name, ids):
+    if ids:
+        deleted_at = now()
+        tombstones.insert_many([
+            {'collection': collection_name, 'docId': str(doc_id), 'deletedAt': deleted_at}
+            for doc_id in ids
+        ])
+
+def encode_token(moment):
+    payload = json.dumps({'t': int(moment.timestamp() * 1000)}).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip('=')
+
+def decode_token(token):
+    # ValueError for anything that is not one of our tokens
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(token + '=' * (-len(token) % 4)))
+        return datetime.fromtimestamp(payload['t'] / 1000, timezone.utc)
+    except Exception:
+        raise ValueError('Invalid since token')
+
+def changes_since(coll, collection_name, token, query=None, projection=None, visible=None):
+    # query/visible: the list's filter as a Mongo query (for snapshots) and as
+    # a predicate; changed documents that stopped matching it (e.g. a rejected
+    # event) are reported as deleted. Returns (changed, deleted ids, next
+    # token, reset).
+    started = now()
+    next_token = encode_token(started - timedelta(seconds=SYNC_OVERLAP_SECONDS))
+    since = decode_token(token) if token else None
+    if since is None or since < started - timedelta(days=SYNC_TOMBSTONE_TTL_DAYS):
+        return list(coll.find(query or {}, projection)), [], next_token, True
+
+    changed, deleted = [], []
+    for doc in coll.find({'updatedAt': {'$gte': since}}, projection):
+        if visible is None or visible(doc):
+            changed.append(doc)
+        else:
+            deleted.append(str(doc['_id']))
+    deleted.extend(
+        doc['docId'] for doc in tombstones.find(
+            {'collection': collection_name, 'deletedAt': {'$gte': since}}, {'_id': 0, 'docId': 1}
+        )
+    )
+    return changed, deleted, next_token, False
@@ -0,0 +1,116 @@
+import asyncio
+from datetime import datetime, timezone
+
+from bson import ObjectId
+from mongomock_motor import AsyncMongoMockClient
+import pytest
+
+import cache
+import database
+
+# The list routes async_app serves natively must answer exactly like the
+# Flask routes they shadow: same status, body bytes, ETag and caching
+# headers. Server-Timing is present on both (the async side reports the
+# total only).
+
+ROUTES = [
+    '/api/events',
+    '/api/events?limit=2',
+    '/api/events?limit=2&sort=date&fields=title,date',
+    '/api/events?limit=2&userId={user_id}',
+    '/api/events?limit=2&cursor=not-a-cursor',
+    '/api/announcements',
+    '/api/forum/threads',
+]
+
+HEADERS = ('Content-Type', 'ETag', 'Cache-Control', 'Access-Control-Allow-Origin')
+
+@pytest.fixture
+def async_app(db, monkeypatch):
+    import async_app
+    # Motor on the same in-memory store the Flask app uses
+    monkeypatch.setattr(
+        async_app, 'AsyncIOMotorClient',
+        lambda *args, **kwargs: AsyncMongoMockClient(mock_mongo_client=database.get_client()),
+    )
+    return async_app
+
+@pytest.fixture
+def user_id(db):
+    user_id = str(db.users.insert_one({'name': 'Member', 'email': 'member@example.com'}).inserted_id)
+    created = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    event_ids = [
+        str(db.events.insert_one({
+            'title': f'Event {index}', 'date': f'2026-02-{index + 1:02d}', 'status': 'published',
+            'registeredUsers': [user_id], 'waitlist': [], 'updatedAt': created,
+        }).inserted_id)
+        for index in range(5)
+    ]
+    db.events.insert_one({'title': 'Draft', 'date': '2026-03-01', 'status': 'draft'})
+    db.registrations.insert_one({'userId': user_id, 'eventId': event_ids[1]})
+    for index in range(3):
+        db.announcements.insert_one({'title': f'Notice {index}', 'date': f'2026-01-0{index + 1}', 'updatedAt': created})
+        db.forum_threads.insert_one({
+            '_id': ObjectId(), 'title': f'Thread {index}', 'tags': ['help'],
+            'createdAt': f'2026-01-0{index + 1}T10:00:00',
+        })
+    return user_id
+
+def fetch_flask(client, path, headers):
+    response = client.get(path, headers=headers)
+    return response.status_code, response.get_data(), response.headers
+
+def fetch_async(async_app, path, headers):
+    async def run():
+        async with async_app.async_api.test_app() as test_app:
+            response = await test_app.test_client().get(path, headers=headers)
+            return response.status_code, await response.get_data(), response.headers
+    return asyncio.run(run())
+
+def fetch_both(client, async_app, monkeypatch, path, headers=None):
+    # Each app starts from an empty cache, so neither answers from the
+    # other's entry
+    results = []
+    for fetch, app in ((fetch_flask, client), (fetch_async, async_app)):
+        monkeypatch.setattr(cache, 'backend', cache.make_backend())
+        results.append(fetch(app, path, headers or {}))
+    return results
+
+@pytest.mark.parametrize('route', ROUTES)
+def test_list_routes_match(client, async_app, user_id, monkeypatch, route):
+    path = route.format(user_id=user_id)
+    (flask_status, flask_body, flask_headers), (async_status, async_body, async_headers) = \
+        fetch_both(client, async_app, monkeypatch, path)
+
+    assert async_status == flask_status
+    assert async_body == flask_body
+    for header in HEADERS:
+        assert async_headers.get(header) == flask_headers.get(header), header
+    assert 'total;dur=' in flask_headers['Server-Timing']
+    assert 'total;dur=' in async_headers['Server-Timing']
+
+def test_lists_over_the_entry_limit_match(client, async_app, user_id, monkeypatch):
+    # Both apps stop buffering and stream the rest uncached
+    monkeypatch.setattr(cache, 'CACHE_MAX_ENTRY_BYTES', 100)
+    (flask_status, flask_body, flask_headers), (async_status, async_body, async_headers) = \
+        fetch_both(client, async_app, monkeypatch, '/api/events')
+    assert flask_status == async_status == 200
+    assert async_body == flask_body
+    assert 'ETag' not in flask_headers and 'ETag' not in async_headers
+
+@pytest.mark.parametrize('route', ['/api/events?limit=2', '/api/announcements', '/api/forum/threads'])
+def test_list_routes_revalidate(client, async_app, user_id, monkeypatch, route):
+    (_, _, flask_headers), (_, _, async_headers) = fetch_both(client, async_app, monkeypatch, route)
+    etag = flask_headers['ETag']
+
+    (flask_status, flask_body, _), (async_status, async_body, _) = \
+        fetch_both(client, async_app, monkeypatch, route, {'If-None-Match': etag})
+    assert flask_status == async_status == 304
+    assert flask_body == async_body == b''
+
+def test_async_routes_share_the_flask_cache(client, async_app, user_id, db):
+    # A write through the Flask app invalidates what the async app cached
+    before = fetch_async(async_app, '/api/announcements', {})[1]
+    assert fetch_async(async_app, '/api/announcements', {})[1] == before
+    client.post('/api/announcements', json={'title': 'New', 'content': 'Hello', 'type': 'info', 'author': 'Admin'})
+    assert b'"New"' in fetch_async(async_app, '/api/announcements', {})[1]
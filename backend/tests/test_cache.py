@@ -0,0 +1,51 @@
+import cache
+
+def entry(size):
+    return {'etag': '', 'mimetype': 'application/json', 'body': b'x' * size}
+
+def test_memory_cache_is_bounded_by_bytes():
+    backend = cache.MemoryCache(100, 250, weigh=lambda value: len(value['body']))
+    backend.set('a', entry(100), 30)
+    backend.set('b', entry(100), 30)
+    backend.get('a')
+    backend.set('c', entry(100), 30)
+    # b was the least recently used
+    assert backend.get('b') is None
+    assert backend.get('a') and backend.get('c')
+    assert backend.size == 200
+
+def test_memory_cache_skips_entries_over_the_byte_limit():
+    backend = cache.MemoryCache(100, 250, weigh=lambda value: len(value['body']))
+    backend.set('a', entry(100), 30)
+    backend.set('a', entry(300), 30)
+    assert backend.get('a') is None
+    assert backend.size == 0
+
+def test_per_user_lists_are_not_cached(client, db):
+    user_id = str(db.users.insert_one({'name': 'Member'}).inserted_id)
+    db.events.insert_one({'title': 'Event', 'date': '2026-01-01', 'status': 'published'})
+
+    shared = client.get('/api/events')
+    assert shared.headers.get('ETag')
+    personal = client.get(f'/api/events?userId={user_id}')
+    assert personal.status_code == 200
+    assert 'ETag' not in personal.headers
+    assert personal.get_json()[0]['isRegistered'] is False
+    assert len(cache.backend.entries) == 1
+
+def test_streamed_lists_over_the_entry_limit_pass_through(client, db, monkeypatch):
+    monkeypatch.setattr(cache, 'CACHE_MAX_ENTRY_BYTES', 200)
+    db.events.insert_many([
+        {'title': f'Event {index}', 'date': '2026-01-01', 'status': 'published'} for index in range(20)
+    ])
+
+    response = client.get('/api/events', buffered=False)
+    assert response.is_streamed
+    assert 'ETag' not in response.headers
+    assert len(response.get_json()) == 20
+    assert not cache.backend.entries
+
+    # A small page still fits and is cached
+    page = client.get('/api/events?limit=1')
+    assert page.headers.get('ETag')
+    assert len(cache.backend.entries) == 1
@@ -0,0 +1,73 @@
+from bson import ObjectId
+import mongomock
+import pytest
+
+# The enrichment routes fetch the referenced events/users with one $in query
+# per request (app.join_references), so the number of queries must not grow
+# with the number of rows.
+
+QUERY_METHODS = ('find', 'find_one', 'aggregate', 'count_documents')
+
+@pytest.fixture
+def queries(monkeypatch):
+    # Counts the read queries the app sends to mongomock
+    calls = []
+    for name in QUERY_METHODS:
+        original = getattr(mongomock.collection.Collection, name)
+        def counted(self, *args, _original=original, _name=name, **kwargs):
+            calls.append((self.name, _name))
+            return _original(self, *args, **kwargs)
+        monkeypatch.setattr(mongomock.collection.Collection, name, counted)
+    return calls
+
+def count_queries(client, queries, path, token=None):
+    headers = {'Authorization': f'Bearer {token}'} if token else {}
+    queries.clear()
+    response = client.get(path, headers=headers)
+    assert response.status_code == 200
+    return len(queries), response.get_json()
+
+def add_user(db, index):
+    return str(db.users.insert_one({'name': f'User {index}', 'email': f'user{index}@example.com'}).inserted_id)
+
+def add_event(db, index, creator=None, status='published'):
+    return str(db.events.insert_one({
+        'title': f'Event {index}', 'date': '2026-01-01', 'creator': creator, 'status': status,
+    }).inserted_id)
+
+@pytest.mark.parametrize('rows', [1, 10, 50])
+def test_user_volunteer_history_queries_are_constant(client, db, queries, rows):
+    user_id = add_user(db, 0)
+    for index in range(rows):
+        db.volunteers.insert_one({'userId': user_id, 'eventId': add_event(db, index), 'status': 'upcoming'})
+    db.volunteers.insert_one({'userId': user_id, 'eventId': str(ObjectId()), 'status': 'upcoming'})
+    count_queries(client, queries, f'/api/volunteers/user/{user_id}')
+
+    count, body = count_queries(client, queries, f'/api/volunteers/user/{user_id}')
+    assert count == 2
+    assert len(body) == rows + 1
+    # A dangling reference is returned as is
+    assert sorted(row['event'] for row in body if 'event' in row) == sorted(f'Event {index}' for index in range(rows))
+
+@pytest.mark.parametrize('rows', [1, 10, 50])
+def test_event_volunteers_queries_are_constant(client, db, queries, rows):
+    event_id = add_event(db, 0)
+    for index in range(rows):
+        db.volunteers.insert_one({'userId': add_user(db, index), 'eventId': event_id, 'status': 'upcoming'})
+    count_queries(client, queries, f'/api/volunteers/event/{event_id}')
+
+    count, body = count_queries(client, queries, f'/api/volunteers/event/{event_id}')
+    assert count == 2
+    assert sorted(row['name'] for row in body) == sorted(f'User {index}' for index in range(rows))
+    assert all(row['email'] for row in body)
+
+@pytest.mark.parametrize('rows', [1, 10, 50])
+def test_pending_events_queries_are_constant(client, db, queries, admin_token, rows):
+    for index in range(rows):
+        add_event(db, index, creator=add_user(db, index), status='pending' if index % 2 else 'draft')
+    add_event(db, rows, creator=add_user(db, rows))
+    count_queries(client, queries, '/api/admin/events/pending', admin_token)
+
+    count, body = count_queries(client, queries, '/api/admin/events/pending', admin_token)
+    assert count == 2
+    assert sorted(event['creator'] for event in body) == sorted(f'User {index}' for index in range(rows))
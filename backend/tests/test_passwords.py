@@ -0,0 +1,25 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import passwords
+
+def test_slow_hash_raises_hashing_busy(monkeypatch):
+    pool = ThreadPoolExecutor(max_workers=1)
+    monkeypatch.setattr(passwords, 'PASSWORD_HASH_WORKERS', 1)
+    monkeypatch.setattr(passwords, 'PASSWORD_HASH_TIMEOUT_SECONDS', 0.05)
+    monkeypatch.setattr(passwords, 'get_pool', lambda: pool)
+    try:
+        with pytest.raises(passwords.HashingBusy):
+            passwords._run(time.sleep, 0.5)
+    finally:
+        pool.shutdown(wait=False)
+
+def test_login_answers_503_when_hashing_times_out(client, db, monkeypatch):
+    db.users.insert_one({'email': 'member@example.com', 'password': passwords.hash_password('pw', offload=False)})
+    def busy(*args):
+        raise passwords.HashingBusy('Password hashing timed out')
+    monkeypatch.setattr(passwords, '_run', busy)
+    response = client.post('/api/auth/login', json={'email': 'member@example.com', 'password': 'pw'})
+    assert response.status_code == 503
@@ -0,0 +1,34 @@
+import asyncio
+
+import pytest
+
+import push
+
+@pytest.fixture
+def broker(monkeypatch):
+    broker = push.Broker()
+    monkeypatch.setattr(push, 'broker', broker)
+    monkeypatch.setattr(push, 'PUSH_MAX_THREAD_SUBSCRIBERS', 2)
+    monkeypatch.setattr(push, 'PUSH_MAX_SUBSCRIBERS', 4)
+    return broker
+
+def test_thread_streams_are_capped_below_the_thread_pool(broker):
+    for _ in range(2):
+        broker.subscribe(push.Subscriber({'events'}))
+    with pytest.raises(push.TooManySubscribers):
+        push.event_stream({'events'}, None)
+
+    async def open_async_streams():
+        # Streams on the event loop only count against PUSH_MAX_SUBSCRIBERS
+        push.async_event_stream({'events'}, None)
+        for _ in range(2):
+            broker.subscribe(push.AsyncSubscriber({'events'}))
+        with pytest.raises(push.TooManySubscribers):
+            push.async_event_stream({'events'}, None)
+    asyncio.run(open_async_streams())
+
+def test_stream_route_answers_503_when_full(client, broker):
+    for _ in range(2):
+        broker.subscribe(push.Subscriber({'events'}))
+    response = client.get('/api/stream')
+    assert response.status_code == 503
@@ -0,0 +1,90 @@
+from bson import ObjectId
+import pytest
+
+# Seat accounting happens in single conditional updates (and update
+# pipelines for the waitlist), so the event document is the only source of
+# truth; the registrations collection mirrors who holds a seat.
+
+@pytest.fixture
+def event_id(db):
+    return str(db.events.insert_one({
+        'title': 'Beach cleanup', 'status': 'published', 'capacity': 2,
+        'registered': 0, 'registeredUsers': [], 'waitlist': [],
+    }).inserted_id)
+
+def register(client, event_id, user_id, waitlist=False):
+    return client.post(f'/api/events/{event_id}/register', json={'userId': user_id, 'waitlist': waitlist})
+
+def unregister(client, event_id, user_id):
+    return client.post(f'/api/events/{event_id}/unregister', json={'userId': user_id})
+
+def event(db, event_id):
+    return db.events.find_one({'_id': ObjectId(event_id)})
+
+def seat_holders(db, event_id):
+    return sorted(row['userId'] for row in db.registrations.find({'eventId': event_id}))
+
+def test_registration_stops_at_capacity(client, db, event_id):
+    assert register(client, event_id, 'u1').get_json() == {'success': True, 'status': 'registered'}
+    assert register(client, event_id, 'u2').status_code == 200
+
+    response = register(client, event_id, 'u3')
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Event is full'
+    assert event(db, event_id)['registered'] == 2
+    assert seat_holders(db, event_id) == ['u1', 'u2']
+
+def test_registering_twice_is_rejected(client, db, event_id):
+    register(client, event_id, 'u1')
+    response = register(client, event_id, 'u1', waitlist=True)
+    assert response.status_code == 400
+    assert response.get_json()['error'] == 'Already registered for this event'
+    assert event(db, event_id)['registeredUsers'] == ['u1']
+
+def test_registering_for_a_missing_event_is_404(client, db):
+    assert register(client, str(ObjectId()), 'u1').status_code == 404
+
+def test_waitlist_takes_a_free_seat_or_queues(client, db, event_id):
+    assert register(client, event_id, 'u1', waitlist=True).get_json()['status'] == 'registered'
+    register(client, event_id, 'u2')
+
+    assert register(client, event_id, 'u3', waitlist=True).get_json() == {'success': True, 'status': 'waitlisted', 'position': 1}
+    assert register(client, event_id, 'u4', waitlist=True).get_json()['position'] == 2
+    doc = event(db, event_id)
+    assert doc['registered'] == 2
+    assert doc['registeredUsers'] == ['u1', 'u2']
+    assert doc['waitlist'] == ['u3', 'u4']
+    assert seat_holders(db, event_id) == ['u1', 'u2']
+
+def test_unregister_promotes_the_head_of_the_waitlist(client, db, event_id):
+    for user_id in ('u1', 'u2', 'u3', 'u4'):
+        register(client, event_id, user_id, waitlist=True)
+
+    assert unregister(client, event_id, 'u1').get_json() == {'success': True}
+    doc = event(db, event_id)
+    assert doc['registered'] == 2
+    assert doc['registeredUsers'] == ['u2', 'u3']
+    assert doc['waitlist'] == ['u4']
+    assert seat_holders(db, event_id) == ['u2', 'u3']
+
+def test_leaving_the_waitlist_promotes_nobody(client, db, event_id):
+    for user_id in ('u1', 'u2', 'u3', 'u4'):
+        register(client, event_id, user_id, waitlist=True)
+
+    assert unregister(client, event_id, 'u3').status_code == 200
+    doc = event(db, event_id)
+    assert doc['registeredUsers'] == ['u1', 'u2']
+    assert doc['waitlist'] == ['u4']
+    assert seat_holders(db, event_id) == ['u1', 'u2']
+    assert unregister(client, event_id, 'u3').status_code == 404
+
+def test_capacity_increase_promotes_from_the_waitlist(client, db, event_id):
+    for user_id in ('u1', 'u2', 'u3', 'u4', 'u5'):
+        register(client, event_id, user_id, waitlist=True)
+
+    assert client.put(f'/api/events/{event_id}', json={'capacity': 4}).status_code == 200
+    doc = event(db, event_id)
+    assert doc['registered'] == 4
+    assert doc['registeredUsers'] == ['u1', 'u2', 'u3', 'u4']
+    assert doc['waitlist'] == ['u5']
+    assert seat_holders(db, event_id) == ['u1', 'u2', 'u3', 'u4']
@@ -0,0 +1,10 @@
+import pytest
+
+@pytest.mark.parametrize('token', ['abc.def.gé', 'gé', 'a.b', ''])
+def test_malformed_tokens_are_anonymous(client, token):
+    response = client.get('/api/test', headers={'Authorization': f'Bearer {token}'})
+    assert response.status_code == 200
+
+def test_malformed_token_on_a_protected_route_is_401(client):
+    response = client.get('/api/admin/stats', headers={'Authorization': 'Bearer abc.def.gé'})
+    assert response.status_code == 401
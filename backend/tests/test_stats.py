@@ -0,0 +1,19 @@
+from datetime import datetime, timedelta
+
+import app as api
+
+def test_one_worker_claims_each_reconcile(db):
+    assert api.claim_reconcile(60)
+    # Other workers (and this one) find the lease held
+    assert not api.claim_reconcile(60)
+    assert not api.claim_reconcile(60)
+
+    db.stats.update_one({'_id': api.STATS_LEASE_ID}, {'$set': {'until': datetime.utcnow() - timedelta(seconds=1)}})
+    assert api.claim_reconcile(60)
+
+def test_dashboard_reads_the_reconciled_document(client, db, admin_token):
+    db.users.insert_one({'name': 'Member', 'status': 'active'})
+    api.reconcile_stats()
+    response = client.get('/api/admin/stats', headers={'Authorization': f'Bearer {admin_token}'})
+    assert response.status_code == 200
+    assert response.get_json()['totalUsers'] == 1
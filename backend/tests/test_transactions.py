@@ -0,0 +1,36 @@
+import threading
+
+import database
+
+def test_fallback_without_sessions_is_logged_once(db, monkeypatch):
+    # mongomock has no sessions: every caller writes without a transaction
+    monkeypatch.setattr(database, '_transactions_supported', None)
+    monkeypatch.setattr(database, 'MONGO_TRANSACTIONS', 'auto')
+    warnings = []
+    monkeypatch.setattr(database.log, 'warning', lambda event, **kwargs: warnings.append(event))
+    barrier = threading.Barrier(8)
+    sessions = []
+
+    def write(session):
+        sessions.append(session)
+        db.volunteers.insert_one({'userId': str(threading.get_ident()), 'eventId': 'e1'})
+
+    def run():
+        barrier.wait()
+        database.run_in_transaction(write)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert sessions == [None] * 8
+    assert db.volunteers.count_documents({}) == 8
+    assert warnings == ['transactions_unavailable']
+
+def test_volunteer_signup_counts_outside_the_transaction(client, db):
+    user_id = str(db.users.insert_one({'name': 'Member', 'volunteerHours': 0}).inserted_id)
+    response = client.post('/api/volunteers', json={'userId': user_id, 'eventId': 'e1', 'hours': 3, 'status': 'completed'})
+    assert response.status_code == 200
+    assert db.stats.find_one({'_id': 'admin'})['totalVolunteers'] == 1
+    assert db.users.find_one({'name': 'Member'})['volunteerHours'] == 3
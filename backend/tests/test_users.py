@@ -0,0 +1,42 @@
+import pytest
+from sessions import issue_token
+
+@pytest.fixture
+def member(db):
+    user = {'name': 'Member', 'email': 'member@example.com', 'role': 'member', 'status': 'active'}
+    user['_id'] = db.users.insert_one(user).inserted_id
+    return user
+
+def auth(token):
+    return {'Authorization': f'Bearer {token}'}
+
+def test_update_user_requires_a_token(client, member):
+    response = client.put(f"/api/users/{member['_id']}", json={'name': 'Changed'})
+    assert response.status_code == 401
+
+def test_users_update_only_themselves(client, db, member):
+    other = db.users.insert_one({'name': 'Other', 'role': 'member'}).inserted_id
+    response = client.put(f'/api/users/{other}', json={'name': 'Changed'}, headers=auth(issue_token(member)))
+    assert response.status_code == 403
+    assert db.users.find_one({'_id': other})['name'] == 'Other'
+
+    response = client.put(f"/api/users/{member['_id']}", json={'name': 'Changed'}, headers=auth(issue_token(member)))
+    assert response.status_code == 200
+    assert db.users.find_one({'_id': member['_id']})['name'] == 'Changed'
+
+@pytest.mark.parametrize('change', [{'role': 'admin'}, {'status': 'suspended'}, {'status': 'active'}])
+def test_only_admins_change_role_or_status(client, db, member, admin_token, change):
+    response = client.put(f"/api/users/{member['_id']}", json=change, headers=auth(issue_token(member)))
+    assert response.status_code == 403
+    assert db.users.find_one({'_id': member['_id']})['role'] == 'member'
+
+    response = client.put(f"/api/users/{member['_id']}", json=change, headers=auth(admin_token))
+    assert response.status_code == 200
+    field, value = next(iter(change.items()))
+    assert db.users.find_one({'_id': member['_id']})[field] == value
+
+def test_users_can_deactivate_their_own_account(client, db, member):
+    # The profile page's "Deactivate Account" button
+    response = client.put(f"/api/users/{member['_id']}", json={'status': 'inactive'}, headers=auth(issue_token(member)))
+    assert response.status_code == 200
+    assert db.users.find_one({'_id': member['_id']})['status'] == 'inactive'
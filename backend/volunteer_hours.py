@@ -0,0 +1,64 @@
+import time
+from datetime import datetime, timezone
+
+# users.volunteerHours is a running total of the hours of a user's completed
+# volunteer records. The write routes keep it current inside a transaction
+# (database.run_in_transaction); recompute() rebuilds it from the records in
+# two server-side commands, to repair drift or after bulk imports.
+#
+#   python volunteer_hours.py
+
+def credited_hours(record):
+    # What one volunteer record contributes to its user's total
+    hours = record.get('hours')
+    if record.get('status') != 'completed' or isinstance(hours, bool) or not isinstance(hours, (int, float)):
+        return 0
+    return hours
+
+def recompute_pipeline(run_at):
+    # Same rule as credited_hours(), as one $group over the completed records
+    # (covered by the volunteers (status, userId, hours) index), merged
+    # straight into users
+    return [
+        {'$match': {'status': 'completed'}},
+        {'$group': {
+            '_id': '$userId',
+            'volunteerHours': {'$sum': {'$cond': [{'$isNumber': '$hours'}, '$hours', 0]}},
+        }},
+        {'$project': {
+            '_id': {'$convert': {'input': '$_id', 'to': 'objectId', 'onError': None, 'onNull': None}},
+            'volunteerHours': 1,
+        }},
+        {'$match': {'_id': {'$ne': None}}},
+        {'$merge': {
+            'into': 'users',
+            'on': '_id',
+            'whenMatched': [{'$set': {
+                'volunteerHours': '$$new.volunteerHours',
+                'volunteerHoursRecomputedAt': {'$literal': run_at},
+            }}],
+            'whenNotMatched': 'discard',
+        }},
+    ]
+
+def recompute(db):
+    # Returns (users whose total was written, seconds). Not transactional
+    # ($merge cannot run in one): a record completed while it runs may be
+    # missed until the next run.
+    started = time.perf_counter()
+    run_at = datetime.now(timezone.utc)
+    db.volunteers.aggregate(recompute_pipeline(run_at))
+    # Users the $group did not reach have no completed hours left
+    db.users.update_many(
+        {'volunteerHoursRecomputedAt': {'$ne': run_at}, 'volunteerHours': {'$exists': True, '$ne': 0}},
+        {'$set': {'volunteerHours': 0, 'volunteerHoursRecomputedAt': run_at}}
+    )
+    written = db.users.count_documents({'volunteerHoursRecomputedAt': run_at})
+    return written, time.perf_counter() - started
+
+if __name__ == '__main__':
+    from database import db
+
+    print("\n⏱  Recomputing volunteer hours...")
+    written, seconds = recompute(db)
+    print(f"✅ Rebuilt volunteerHours for {written} users in {seconds:.2f}s\n")
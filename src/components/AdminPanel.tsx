@@ -192,7 +192,35 @@ export function AdminPanel({ user }: AdminPanelProps) {
         <TabsContent value="events" className="mt-6">
           <Card>
             <CardHeader>
-              <h3>Pending Event Approvals</h3>
+              <div className="flex items-center justify-between">
+                <h3>Pending Event Approvals</h3>
+                {pendingEvents.length > 1 && (
+                  <div className="flex gap-2">
+                    <Button size="sm" className="bg-emerald-600 hover:bg-emerald-700" onClick={async () => {
+                      try {
+                        await adminAPI.bulkApproveEvents(pendingEvents.map((event) => event._id));
+                        await loadAdminData();
+                      } catch (err: any) {
+                        setError(err.message || "Approve failed");
+                      }
+                    }}>
+                      <CheckCircle className="h-4 w-4 mr-1" />
+                      Approve All
+                    </Button>
+                    <Button variant="destructive" size="sm" onClick={async () => {
+                      try {
+                        await adminAPI.bulkRejectEvents(pendingEvents.map((event) => event._id));
+                        await loadAdminData();
+                      } catch (err: any) {
+                        setError(err.message || "Reject failed");
+                      }
+                    }}>
+                      <XCircle className="h-4 w-4 mr-1" />
+                      Reject All
+                    </Button>
+                  </div>
+                )}
+              </div>
             </CardHeader>
             <CardContent>
               <Table>
@@ -8,7 +8,7 @@ import { Input } from "./ui/input";
 import { Label } from "./ui/label";
 import { Bell, Plus, AlertTriangle, Info, Calendar } from "lucide-react";
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle, DialogTrigger } from "./ui/dialog";
-import { announcementsAPI } from "../services/api";
+import { announcementsAPI, updatesAPI } from "../services/api";
 import { Alert, AlertDescription } from "./ui/alert";
 
 interface AnnouncementsProps {
@@ -43,6 +43,20 @@ export function Announcements({ user }: AnnouncementsProps) {
     };
   }, []);
 
+  useEffect(() => {
+    // Apply pushed changes instead of polling the list
+    const sameId = (a: any, b: any) => (a._id || a.id) === b._id;
+    return updatesAPI.subscribe(["announcements"], {
+      "announcement.created": (announcement) =>
+        setAnnouncements((current) =>
+          current.some((a) => sameId(a, announcement)) ? current : [announcement, ...current]
+        ),
+      "announcement.deleted": (deleted) =>
+        setAnnouncements((current) => current.filter((a) => !sameId(a, deleted))),
+      resync: async () => setAnnouncements(await announcementsAPI.getAll()),
+    });
+  }, []);
+
   const getTypeColor = (type: string) => {
     switch (type) {
       case "Emergency":
@@ -17,22 +17,30 @@ interface CalendarPageProps {
 export function CalendarPage({ onPageChange, user }: CalendarPageProps) {
   const [date, setDate] = useState<Date | undefined>(new Date());
   const [view, setView] = useState<"month" | "week" | "day">("month");
+  const [month, setMonth] = useState<Date>(new Date());
   const [events, setEvents] = useState<any[]>([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
+    // Only the visible month is fetched; the server groups events by day
+    const pad = (n: number) => String(n).padStart(2, "0");
+    const year = month.getFullYear();
+    const from = `${year}-${pad(month.getMonth() + 1)}-01`;
+    const to = `${year}-${pad(month.getMonth() + 1)}-${pad(new Date(year, month.getMonth() + 1, 0).getDate())}`;
     (async () => {
       try {
-        const data = await eventsAPI.getAll(user?.id);
+        const data = await eventsAPI.getCalendar(from, to, user?.id);
         setEvents(
-          data.map((e: any) => ({
-            id: e._id,
-            title: e.title,
-            date: e.date,
-            time: e.time,
-            status: e.isRegistered ? "registered" as const : "created" as const,
-            location: e.location,
-          }))
+          data.days.flatMap((day: any) =>
+            day.events.map((e: any) => ({
+              id: e._id,
+              title: e.title,
+              date: day.date,
+              time: e.time,
+              status: e.isRegistered ? "registered" as const : "created" as const,
+              location: e.location,
+            }))
+          )
         );
       } catch (err: any) {
         console.error("Failed to load events:", err);
@@ -40,7 +48,7 @@ export function CalendarPage({ onPageChange, user }: CalendarPageProps) {
         setLoading(false);
       }
     })();
-  }, [user?.id]);
+  }, [user?.id, month.getFullYear(), month.getMonth()]);
 
   const getStatusColor = (status: string) => {
     switch (status) {
@@ -72,7 +80,8 @@ export function CalendarPage({ onPageChange, user }: CalendarPageProps) {
   const eventDates = events
     .map((e) => {
       try {
-        const eventDate = new Date(e.date);
+        // Calendar days are local dates, not UTC midnight
+        const eventDate = new Date(`${e.date}T00:00:00`);
         if (isNaN(eventDate.getTime())) return null;
         return eventDate;
       } catch {
@@ -85,7 +94,7 @@ export function CalendarPage({ onPageChange, user }: CalendarPageProps) {
   const selectedDateEvents = events.filter((e) => {
     if (!date) return false;
     try {
-      const eventDate = new Date(e.date);
+      const eventDate = new Date(`${e.date}T00:00:00`);
       if (isNaN(eventDate.getTime())) return false;
       return eventDate.toDateString() === date.toDateString();
     } catch {
@@ -159,6 +168,8 @@ export function CalendarPage({ onPageChange, user }: CalendarPageProps) {
                   mode="single"
                   selected={date}
                   onSelect={setDate}
+                  month={month}
+                  onMonthChange={setMonth}
                   className="rounded-md border"
                   modifiers={{
                     hasEvent: eventDates,
@@ -9,7 +9,7 @@ import { Select, SelectContent, SelectItem, SelectTrigger, SelectValue } from ".
 import { Avatar, AvatarFallback } from "./ui/avatar";
 import { MessageSquare, Plus, ThumbsUp, Search, Pin, Flag } from "lucide-react";
 import { Dialog, DialogContent, DialogDescription, DialogHeader, DialogTitle, DialogTrigger } from "./ui/dialog";
-import { forumAPI } from "../services/api";
+import { forumAPI, updatesAPI } from "../services/api";
 import { Alert, AlertDescription } from "./ui/alert";
 
 interface ForumProps {
@@ -44,6 +44,24 @@ export function Forum({ user }: ForumProps) {
     };
   }, []);
 
+  useEffect(() => {
+    // Apply pushed changes instead of polling the list
+    const sameId = (a: any, b: any) => (a._id || a.id) === b._id;
+    return updatesAPI.subscribe(["forum"], {
+      "thread.created": (thread) =>
+        setThreads((current) =>
+          current.some((t) => sameId(t, thread)) ? current : [thread, ...current]
+        ),
+      "thread.deleted": (deleted) =>
+        setThreads((current) => current.filter((t) => !sameId(t, deleted))),
+      "thread.pinned": (pinned) =>
+        setThreads((current) =>
+          current.map((t) => (sameId(t, pinned) ? { ...t, isPinned: true } : t))
+        ),
+      resync: async () => setThreads(await forumAPI.getThreads()),
+    });
+  }, []);
+
   const getCategoryColor = (category: string) => {
     switch (category) {
       case "Ideas":
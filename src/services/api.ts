@@ -1,11 +1,24 @@
 const API_BASE_URL = 'http://localhost:5000/api';
 
+// Session token issued by login/register, sent as a bearer token
+let sessionToken: string | null = sessionStorage.getItem('sessionToken');
+
+function setSessionToken(token: string | null) {
+  sessionToken = token;
+  if (token) {
+    sessionStorage.setItem('sessionToken', token);
+  } else {
+    sessionStorage.removeItem('sessionToken');
+  }
+}
+
 // Helper function for API calls
 async function apiCall(endpoint: string, options: RequestInit = {}) {
   const response = await fetch(`${API_BASE_URL}${endpoint}`, {
     ...options,
     headers: {
       'Content-Type': 'application/json',
+      ...(sessionToken ? { Authorization: `Bearer ${sessionToken}` } : {}),
       ...options.headers,
     },
   });
@@ -20,17 +33,31 @@ async function apiCall(endpoint: string, options: RequestInit = {}) {
 
 // Auth API
 export const authAPI = {
-  login: (email: string, password: string) =>
-    apiCall('/auth/login', {
+  login: async (email: string, password: string) => {
+    const response = await apiCall('/auth/login', {
       method: 'POST',
       body: JSON.stringify({ email, password }),
-    }),
+    });
+    if (response.token) setSessionToken(response.token);
+    return response;
+  },
 
-  register: (name: string, email: string, password: string) =>
-    apiCall('/auth/register', {
+  register: async (name: string, email: string, password: string) => {
+    const response = await apiCall('/auth/register', {
       method: 'POST',
       body: JSON.stringify({ name, email, password }),
-    }),
+    });
+    if (response.token) setSessionToken(response.token);
+    return response;
+  },
+
+  logout: async () => {
+    try {
+      await apiCall('/auth/logout', { method: 'POST' });
+    } finally {
+      setSessionToken(null);
+    }
+  },
 
   forgotPassword: (email: string) =>
     apiCall('/auth/forgot-password', {
@@ -69,6 +96,43 @@ export const usersAPI = {
 // Events API
 export const eventsAPI = {
   getAll: (userId?: string) => apiCall(userId ? `/events?userId=${userId}` : '/events'),
+  // Keyset-paginated listing: resolves to { events, nextCursor }
+  getPage: (params: { userId?: string; limit?: number; cursor?: string; sort?: '_id' | 'date' } = {}) => {
+    const query = new URLSearchParams({ limit: String(params.limit ?? 50) });
+    if (params.userId) query.set('userId', params.userId);
+    if (params.cursor) query.set('cursor', params.cursor);
+    if (params.sort) query.set('sort', params.sort);
+    return apiCall(`/events?${query.toString()}`);
+  },
+  // Delta sync: resolves to { changed, deleted, nextSince, reset }; pass '' for a full snapshot
+  getChanges: (since: string, userId?: string) => {
+    const query = new URLSearchParams({ since });
+    if (userId) query.set('userId', userId);
+    return apiCall(`/events?${query.toString()}`);
+  },
+  // Ranked search: resolves to { events, nextCursor, facets, total, truncated } (no facets after page 1)
+  search: (params: { q?: string; category?: string; tags?: string; from?: string; to?: string; limit?: number; cursor?: string; userId?: string } = {}) => {
+    const query = new URLSearchParams();
+    Object.entries(params).forEach(([key, value]) => {
+      if (value !== undefined && value !== '') query.set(key, String(value));
+    });
+    return apiCall(`/events/search?${query.toString()}`);
+  },
+  // Per-day counts and summaries for from..to (YYYY-MM-DD, at most ~3 months)
+  getCalendar: (from: string, to: string, userId?: string) => {
+    const query = new URLSearchParams({ from, to });
+    if (userId) query.set('userId', userId);
+    return apiCall(`/events/calendar?${query.toString()}`);
+  },
+  // Nearest first within radiusKm; resolves to { events (with distance in metres), nextCursor }
+  getNearby: (lat: number, lng: number, params: { radiusKm?: number; limit?: number; cursor?: string; userId?: string } = {}) => {
+    const query = new URLSearchParams({ lat: String(lat), lng: String(lng) });
+    if (params.radiusKm) query.set('radius', String(params.radiusKm));
+    if (params.limit) query.set('limit', String(params.limit));
+    if (params.cursor) query.set('cursor', params.cursor);
+    if (params.userId) query.set('userId', params.userId);
+    return apiCall(`/events/nearby?${query.toString()}`);
+  },
   getById: (id: string) => apiCall(`/events/${id}`),
   getUserEvents: (userId: string) => apiCall(`/events/user/${userId}`),
   create: (data: any) =>
@@ -85,8 +149,13 @@ export const eventsAPI = {
     apiCall(`/events/${id}`, {
       method: 'DELETE',
     }),
-  register: (id: string, userId: string) =>
+  register: (id: string, userId: string, waitlist = false) =>
     apiCall(`/events/${id}/register`, {
+      method: 'POST',
+      body: JSON.stringify({ userId, waitlist }),
+    }),
+  unregister: (id: string, userId: string) =>
+    apiCall(`/events/${id}/unregister`, {
       method: 'POST',
       body: JSON.stringify({ userId }),
     }),
@@ -95,6 +164,7 @@ export const eventsAPI = {
 // Announcements API
 export const announcementsAPI = {
   getAll: () => apiCall('/announcements'),
+  getChanges: (since: string) => apiCall(`/announcements?since=${encodeURIComponent(since)}`),
   create: (data: any) =>
     apiCall('/announcements', {
       method: 'POST',
@@ -109,6 +179,7 @@ export const announcementsAPI = {
 // Forum API
 export const forumAPI = {
   getThreads: () => apiCall('/forum/threads'),
+  getChanges: (since: string) => apiCall(`/forum/threads?since=${encodeURIComponent(since)}`),
   createThread: (data: any) =>
     apiCall('/forum/threads', {
       method: 'POST',
@@ -132,6 +203,12 @@ export const volunteersAPI = {
       method: 'POST',
       body: JSON.stringify(data),
     }),
+  // role / hours / status; completing a record credits its hours to the user
+  update: (id: string, data: { role?: string; hours?: number; status?: string }) =>
+    apiCall(`/volunteers/${id}`, {
+      method: 'PUT',
+      body: JSON.stringify(data),
+    }),
   getUserHistory: (userId: string) => apiCall(`/volunteers/user/${userId}`),
   getEventVolunteers: (eventId: string) => apiCall(`/volunteers/event/${eventId}`),
 };
@@ -148,4 +225,47 @@ export const adminAPI = {
     apiCall(`/admin/events/${id}/reject`, {
       method: 'PUT',
     }),
-};
\ No newline at end of file
+  // Bulk moderation: resolve to { results: [{ id, result }], counts }, where result is
+  // ok | unchanged | not_found | conflict
+  bulkApproveEvents: (ids: string[]) =>
+    apiCall('/admin/events/bulk-approve', {
+      method: 'POST',
+      body: JSON.stringify({ ids }),
+    }),
+  bulkRejectEvents: (ids: string[]) =>
+    apiCall('/admin/events/bulk-reject', {
+      method: 'POST',
+      body: JSON.stringify({ ids }),
+    }),
+  bulkDeleteAnnouncements: (ids: string[]) =>
+    apiCall('/admin/announcements/bulk-delete', {
+      method: 'POST',
+      body: JSON.stringify({ ids }),
+    }),
+  bulkPinThreads: (ids: string[]) =>
+    apiCall('/admin/forum/threads/bulk-pin', {
+      method: 'POST',
+      body: JSON.stringify({ ids }),
+    }),
+  // Rebuilds every user's volunteerHours from the volunteer records
+  recomputeVolunteerHours: () =>
+    apiCall('/admin/volunteers/recompute-hours', {
+      method: 'POST',
+    }),
+};
+
+// Live updates (server-sent events): small deltas such as
+// "announcement.created" or "thread.pinned" instead of re-fetching lists.
+// "resync" means updates were missed and the list should be fetched again.
+export type UpdateHandlers = Record<string, (data: any) => void>;
+
+export const updatesAPI = {
+  // Returns a function that closes the stream
+  subscribe: (topics: Array<'announcements' | 'forum' | 'events'>, handlers: UpdateHandlers) => {
+    const source = new EventSource(`${API_BASE_URL}/stream?topics=${topics.join(',')}`);
+    for (const [event, handler] of Object.entries(handlers)) {
+      source.addEventListener(event, (e) => handler(JSON.parse((e as MessageEvent).data)));
+    }
+    return () => source.close();
+  },
+};